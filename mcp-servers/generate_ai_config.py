@@ -5,6 +5,57 @@ import os
 import subprocess
 import sys
 import re
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Generated output files that live next to the inputs and must not be re-read
+_OUTPUT_NAMES = frozenset({"gemini_mcp_config.json", "windsurf_mcp_config.json"})
+
+# Gemini CLI settings file updated by --gemini-cli
+_GEMINI_SETTINGS_PATH = os.path.join(os.path.expanduser("~"), ".gemini", "settings.json")
+
+# Matches ${VAR_NAME} placeholders in config values
+_VAR_RE = re.compile(r'\$\{([^}]+)\}')
+
+def parse_json(data):
+    """Parses JSON from raw bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def load_json_file(path):
+    """Parses a JSON file, reading raw bytes so orjson can skip str decoding."""
+    with open(path, 'rb') as f:
+        return parse_json(f.read())
+
+def dump_json_bytes(obj, sort_keys=True):
+    """Serializes obj as indented UTF-8 JSON bytes, with sorted keys by default."""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2, sort_keys=sort_keys).encode('utf-8')
+
+def dump_json(obj):
+    """Serializes obj as indented JSON text with sorted keys."""
+    return dump_json_bytes(obj).decode('utf-8')
+
+def load_server_config(entry):
+    """Loads one server config file.
+
+    Runs on a worker thread, so errors are returned rather than raised and
+    reported by the caller in file order.
+
+    Returns:
+        A (filename, config, error) tuple; config is None when error is set.
+    """
+    try:
+        return entry.name, load_json_file(entry.path), None
+    except Exception as e:
+        return entry.name, None, e
 
 def copy_to_clipboard(text):
     """Copies the given text to the system clipboard (macOS only)."""
@@ -19,47 +70,64 @@ def copy_to_clipboard(text):
         print(f"Failed to copy to clipboard: {e}")
 
 def replace_env_vars(obj, replacements):
-    """Recursively replace environment variable placeholders in the config object."""
-    if isinstance(obj, dict):
-        return {k: replace_env_vars(v, replacements) for k, v in obj.items()}
-    elif isinstance(obj, list):
-        return [replace_env_vars(i, replacements) for i in obj]
-    elif isinstance(obj, str):
-        # Look for ${VAR_NAME} pattern
-        matches = re.findall(r'\$\{([^}]+)\}', obj)
-        result = obj
-        for var_name in matches:
-            if var_name in replacements:
-                result = result.replace(f"${{{var_name}}}", replacements[var_name])
-            elif var_name in os.environ:
-                result = result.replace(f"${{{var_name}}}", os.environ[var_name])
-        return result
-    else:
+    """Replace environment variable placeholders in the config object.
+
+    Containers are updated in place with an explicit stack walk rather than
+    rebuilt recursively, and the walk is skipped entirely when the serialized
+    config contains no "${" at all.
+    """
+    def replacer(match):
+        var_name = match.group(1)
+        if var_name in replacements:
+            return replacements[var_name]
+        return os.environ.get(var_name, match.group(0))
+
+    if isinstance(obj, str):
+        return _VAR_RE.sub(replacer, obj) if '${' in obj else obj
+    if not isinstance(obj, (dict, list)):
+        return obj
+
+    # Fast path: nothing to substitute anywhere in the tree
+    serialized = orjson.dumps(obj) if orjson is not None else json.dumps(obj).encode('utf-8')
+    if b'${' not in serialized:
         return obj
 
+    stack = [obj]
+    while stack:
+        node = stack.pop()
+        items = node.items() if isinstance(node, dict) else enumerate(node)
+        for key, value in items:
+            if isinstance(value, str):
+                # Only rebuild strings that actually hold a placeholder
+                if '${' in value:
+                    node[key] = _VAR_RE.sub(replacer, value)
+            elif isinstance(value, (dict, list)):
+                stack.append(value)
+    return obj
+
 def update_gemini_cli_settings(new_config):
     """Updates the .gemini/settings.json file with the new MCP configuration."""
-    home_dir = os.path.expanduser("~")
-    settings_path = os.path.join(home_dir, ".gemini", "settings.json")
+    settings_path = _GEMINI_SETTINGS_PATH
     
-    if not os.path.exists(settings_path):
-        print(f"Gemini settings file not found at {settings_path}")
-        return
-
     try:
-        with open(settings_path, 'r') as f:
-            settings = json.load(f)
-        
-        # Update or add mcpServers section
-        # We assume new_config has "mcpServers" key
-        if "mcpServers" in new_config:
-            settings["mcpServers"] = new_config["mcpServers"]
-        
-        with open(settings_path, 'w') as f:
-            json.dump(settings, f, indent=2)
+        # Read and rewrite through a single handle
+        with open(settings_path, 'rb+') as f:
+            settings = parse_json(f.read())
+            
+            # Update or add mcpServers section
+            # We assume new_config has "mcpServers" key
+            if "mcpServers" in new_config:
+                settings["mcpServers"] = new_config["mcpServers"]
+            
+            f.seek(0)
+            # Keep the user's own key order; only generated output is sorted
+            f.write(dump_json_bytes(settings, sort_keys=False))
+            f.truncate()
             
         print(f"Updated Gemini CLI settings at {settings_path}")
         
+    except FileNotFoundError:
+        print(f"Gemini settings file not found at {settings_path}")
     except Exception as e:
         print(f"Failed to update Gemini CLI settings: {e}")
 
@@ -98,21 +166,31 @@ def generate_config():
     if not args.stdout:
         print(f"Scanning {mcp_dir} for MCP server configurations...")
     
-    # Iterate over all files in the directory
-    for filename in os.listdir(mcp_dir):
-        if not filename.endswith(".json"):
-            continue
-            
-        # Skip the default output file name to avoid recursion if it exists
-        if filename in ["gemini_mcp_config.json", "windsurf_mcp_config.json"]:
-            continue
-            
-        file_path = os.path.join(mcp_dir, filename)
+    # Iterate over all files in the directory; scandir entries cache their
+    # file type so no extra stat() is needed per file
+    with os.scandir(mcp_dir) as it:
+        entries = sorted(
+            (
+                e for e in it
+                if e.name.endswith(".json")
+                # Skip the default output file name to avoid recursion if it exists
+                and e.name not in _OUTPUT_NAMES
+                and e.is_file(follow_symlinks=False)
+            ),
+            key=lambda e: e.name,
+        )
+
+    # Read and parse the files concurrently; results come back in entry order
+    # so the merge below stays single-threaded and deterministic
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        loaded = list(executor.map(load_server_config, entries))
+
+    for filename, server_config, error in loaded:
         server_name = os.path.splitext(filename)[0]
         
         try:
-            with open(file_path, 'r') as f:
-                server_config = json.load(f)
+            if error is not None:
+                raise error
             
             # Check if it's a FastMCP config (has "deployment") or pre-formatted MCP config
             if "mcpServers" in server_config:
@@ -162,14 +240,12 @@ def generate_config():
         update_gemini_cli_settings(config)
         return
 
-    json_output = json.dumps(config, indent=2)
-
     if args.stdout:
-        print(json_output)
+        print(dump_json(config))
         return
 
     if args.clipboard:
-        copy_to_clipboard(json_output)
+        copy_to_clipboard(dump_json(config))
         return
 
     # Determine output path
@@ -185,11 +261,13 @@ def generate_config():
     try:
         # Create directory if it doesn't exist (for custom paths)
         output_dir = os.path.dirname(output_path)
-        if output_dir and not os.path.exists(output_dir):
-            os.makedirs(output_dir)
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
 
-        with open(output_path, 'w') as f:
-            f.write(json_output)
+        # Write the encoded bytes straight through a 64 KiB buffer, skipping
+        # the intermediate str and its re-encoding
+        with open(output_path, 'wb', buffering=65536) as f:
+            f.write(dump_json_bytes(config))
         print(f"Generated config at {output_path}")
     except Exception as e:
         print(f"Error writing to {output_path}: {e}")
@@ -84,12 +84,28 @@ Environment Variables:
     # Start the server
     try:
         import uvicorn
+        
+        # Prefer uvloop's libuv event loop and the httptools parser for the
+        # WebSocket/HTTP I/O paths
+        try:
+            import uvloop  # noqa: F401
+            loop = "uvloop"
+        except ImportError:
+            loop = "asyncio"
+        try:
+            import httptools  # noqa: F401
+            http = "httptools"
+        except ImportError:
+            http = "h11"
+        
         uvicorn.run(
             "multirig.app:app",
             host=args.host,
             port=args.port,
             reload=args.reload,
-            log_level=args.log_level
+            log_level=args.log_level,
+            loop=loop,
+            http=http
         )
     except KeyboardInterrupt:
         print("\nShutting down MultiRig...")
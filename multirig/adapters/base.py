@@ -7,8 +7,9 @@ Handles Zenoh pub/sub, state polling, command execution, and safety checks.
 import asyncio
 import logging
 from abc import ABC, abstractmethod
+from bisect import bisect_right
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional, Tuple
 
 from multirig.messages import RigState, RigCommand, RigCaps
 from multirig.zenoh import keys
@@ -60,6 +61,9 @@ class BaseRigAdapter(ABC):
         # Safety configuration (to be set by config)
         self._allow_out_of_band = True
         self._band_presets: list = []
+        # Enabled preset ranges merged and sorted by lower bound, for bisect
+        self._band_lowers: List[int] = []
+        self._band_uppers: List[int] = []
     
     def set_safety_config(self, allow_out_of_band: bool = True, 
                          band_presets: Optional[list] = None):
@@ -72,6 +76,22 @@ class BaseRigAdapter(ABC):
         """
         self._allow_out_of_band = allow_out_of_band
         self._band_presets = band_presets or []
+        
+        spans: List[Tuple[int, int]] = sorted(
+            (preset.lower_hz, preset.upper_hz)
+            for preset in self._band_presets
+            if preset.enabled and preset.lower_hz and preset.upper_hz
+        )
+        lowers: List[int] = []
+        uppers: List[int] = []
+        for lo, hi in spans:
+            if uppers and lo <= uppers[-1]:
+                uppers[-1] = max(uppers[-1], hi)
+            else:
+                lowers.append(lo)
+                uppers.append(hi)
+        self._band_lowers = lowers
+        self._band_uppers = uppers
     
     async def start(self):
         """Start the adapter: connect, subscribe, and begin polling."""
@@ -213,14 +233,8 @@ class BaseRigAdapter(ABC):
             freq = command.params.get("frequency")
             if freq and not self._allow_out_of_band and self._band_presets:
                 # Check if frequency is within any configured band preset
-                in_band = False
-                for preset in self._band_presets:
-                    if not preset.enabled:
-                        continue
-                    if preset.lower_hz and preset.upper_hz:
-                        if preset.lower_hz <= freq <= preset.upper_hz:
-                            in_band = True
-                            break
+                i = bisect_right(self._band_lowers, freq) - 1
+                in_band = i >= 0 and freq <= self._band_uppers[i]
                 
                 if not in_band:
                     logger.warning(
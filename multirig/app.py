@@ -9,8 +9,14 @@ from contextlib import asynccontextmanager
 from pathlib import Path
 
 from fastapi import FastAPI
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, JSONResponse
+try:
+    import orjson  # noqa: F401
+    from fastapi.responses import ORJSONResponse
+except ImportError:
+    ORJSONResponse = JSONResponse
 
 
 from multirig.gateway.routes import router
@@ -58,9 +64,13 @@ app = FastAPI(
     title="MultiRig",
     description="Control and sync multiple ham radio rigs",
     version="0.2.0",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
+# Compress larger JSON payloads (rig state, config) for remote clients
+app.add_middleware(GZipMiddleware, minimum_size=512)
+
 # Include REST API routes
 app.include_router(router)
 
@@ -96,12 +106,28 @@ else:
 def run():
     """Run the application using uvicorn."""
     import uvicorn
+    
+    # Prefer uvloop's libuv event loop and the httptools parser for the
+    # WebSocket/HTTP I/O paths
+    try:
+        import uvloop  # noqa: F401
+        loop = "uvloop"
+    except ImportError:
+        loop = "asyncio"
+    try:
+        import httptools  # noqa: F401
+        http = "httptools"
+    except ImportError:
+        http = "h11"
+    
     uvicorn.run(
         "multirig.app:app",
         host="0.0.0.0",
         port=8000,
         reload=False,
-        log_level="info"
+        log_level="info",
+        loop=loop,
+        http=http
     )
 
 
@@ -169,10 +169,7 @@ class ApplicationManager:
         # Stop all adapters
         if self.adapters:
             logger.info("Stopping rig adapters...")
-            for rig_id, adapter in self.adapters.items():
-                logger.info(f"  - Stopping {rig_id}...")
-                await adapter.stop()
-                logger.info(f"    ✓ {rig_id} stopped")
+            await _stop_adapters(self.adapters)
             logger.info("✓ All rig adapters stopped")
         
         # Stop config store
@@ -244,13 +241,15 @@ class ApplicationManager:
         # For now, do a full restart of affected components
         
         # Stop adapters for rigs that were removed or changed
-        for rig_id in list(self.adapters.keys()):
-            # Check if rig still exists in new config
-            rig_found = any(r.rig_id == rig_id for r in new_config.rigs)
-            if not rig_found:
-                logger.info(f"Stopping removed rig: {rig_id}")
-                await self.adapters[rig_id].stop()
-                del self.adapters[rig_id]
+        new_rig_ids = {r.rig_id for r in new_config.rigs}
+        removed = {
+            rig_id: self.adapters.pop(rig_id)
+            for rig_id in list(self.adapters.keys())
+            if rig_id not in new_rig_ids
+        }
+        for rig_id in removed:
+            logger.info(f"Stopping removed rig: {rig_id}")
+        await _stop_adapters(removed)
         
         # Start adapters for new rigs
         for rig_config in new_config.rigs:
@@ -281,6 +280,23 @@ class ApplicationManager:
         logger.info("✓ Configuration reloaded")
 
 
+async def _stop_adapters(adapters: Dict[str, BaseRigAdapter]):
+    """Stop adapters concurrently so one slow disconnect doesn't delay the rest.
+    
+    Args:
+        adapters: Adapters to stop, keyed by rig ID
+    """
+    results = await asyncio.gather(
+        *(adapter.stop() for adapter in adapters.values()),
+        return_exceptions=True
+    )
+    for rig_id, result in zip(adapters, results):
+        if isinstance(result, Exception):
+            logger.error(f"Error stopping {rig_id}: {result}")
+        else:
+            logger.info(f"    ✓ {rig_id} stopped")
+
+
 # Global application instance
 _app_manager: Optional[ApplicationManager] = None
 
@@ -10,12 +10,16 @@ This module defines the configuration structure for the application, including:
 from __future__ import annotations
 
 import os
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional, Literal, List, Any, Dict
+from typing import Optional, Literal, List, Any, Dict, Tuple
 
 import yaml
 from pydantic import BaseModel, Field, model_validator
 
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 def _normalize_band_label(label: str) -> str:
     """Normalize a band label to lowercase for comparison."""
@@ -243,9 +247,17 @@ def get_config_path(profile_name: str = "default") -> Path:
     return get_config_dir() / f"{profile_name}.yaml"
 
 
+# Parsed configs keyed by path, validated by (mtime_ns, size) of the YAML file
+_CONFIG_CACHE_MAX = 16
+_config_cache: "OrderedDict[str, Tuple[int, int, bytes]]" = OrderedDict()
+
+
 def load_config(profile_name: str = "default") -> AppConfig:
     """Load configuration from a profile.
     
+    Parsed configs are cached and reused until the file's mtime or size
+    changes, so repeated loads of an unchanged profile skip the YAML parse.
+    
     Args:
         profile_name: Name of the profile to load
         
@@ -253,17 +265,32 @@ def load_config(profile_name: str = "default") -> AppConfig:
         Loaded configuration, or default if file doesn't exist
     """
     config_path = get_config_path(profile_name)
+    key = str(config_path)
     
-    if not config_path.exists():
+    try:
+        st = config_path.stat()
+    except OSError:
+        _config_cache.pop(key, None)
         return AppConfig()
     
+    cached = _config_cache.get(key)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        _config_cache.move_to_end(key)
+        return AppConfig.model_validate_json(cached[2])
+    
     try:
-        with open(config_path, 'r') as f:
-            data = yaml.safe_load(f)
-            return AppConfig(**data)
+        with open(config_path, 'rb') as f:
+            data = yaml.load(f, Loader=_YAML_LOADER)
+            config = AppConfig(**data)
     except Exception as e:
         print(f"Error loading config from {config_path}: {e}")
         return AppConfig()
+    
+    _config_cache[key] = (st.st_mtime_ns, st.st_size, config.model_dump_json().encode('utf-8'))
+    _config_cache.move_to_end(key)
+    while len(_config_cache) > _CONFIG_CACHE_MAX:
+        _config_cache.popitem(last=False)
+    return config
 
 
 def save_config(config: AppConfig, profile_name: str = "default"):
@@ -280,12 +307,13 @@ def save_config(config: AppConfig, profile_name: str = "default"):
     config_dir.mkdir(parents=True, exist_ok=True)
     
     config_path = get_config_path(profile_name)
+    _config_cache.pop(str(config_path), None)
     
     try:
         with open(config_path, 'w') as f:
             # Serialize to dict then to YAML
             data = config.model_dump(exclude={"test_mode"})
-            yaml.safe_dump(data, f, default_flow_style=False, sort_keys=False)
+            yaml.dump(data, f, Dumper=_YAML_DUMPER, default_flow_style=False, sort_keys=False)
     except Exception as e:
         print(f"Error saving config to {config_path}: {e}")
 
@@ -317,6 +345,7 @@ def delete_profile(profile_name: str):
         raise ValueError("Cannot delete default profile")
     
     config_path = get_config_path(profile_name)
+    _config_cache.pop(str(config_path), None)
     if config_path.exists():
         config_path.unlink()
 
@@ -12,7 +12,7 @@ import logging
 from datetime import datetime
 from typing import Optional, Set, Dict
 
-from multirig.config import AppConfig, load_config, save_config
+from multirig.config import AppConfig, RigConfig, load_config, save_config
 from multirig.messages import RigState
 from multirig.messages.config import DiscoveredRig, ConfigDiscovered, ConfigChanged
 from multirig.zenoh import keys
@@ -21,6 +21,10 @@ from multirig.zenoh.serialization import serialize, deserialize, deserialize_dic
 
 logger = logging.getLogger(__name__)
 
+# Quiet period before a config change is written; bursts of UI edits
+# within this window produce a single write
+SAVE_DELAY_S = 0.25
+
 
 class ConfigStore:
     """
@@ -60,20 +64,68 @@ class ConfigStore:
         self._state_subscriber: Optional[Subscriber] = None
         self._discovered_publisher: Optional[Publisher] = None
         self._changed_publisher: Optional[Publisher] = None
+        
+        # Pending debounced save, and whether the config changed since the
+        # last snapshot was taken for writing
+        self._save_task: Optional[asyncio.Task] = None
+        self._save_dirty = False
+        
+        # Serialized config for query replies, rebuilt after each change
+        self._config_payload: Optional[bytes] = None
     
     def load_config(self):
         """Load configuration from YAML file."""
         self.config = load_config(self.profile_name)
+        self._config_payload = None
         self._configured_rig_ids = {rig.rig_id for rig in self.config.rigs}
         logger.info(f"Loaded config with {len(self.config.rigs)} rigs: {self._configured_rig_ids}")
     
     def save_config(self):
-        """Save configuration to YAML file."""
+        """Save configuration to YAML file.
+        
+        Inside a running event loop the write is debounced by SAVE_DELAY_S
+        and done in a worker thread; changes made before the pending save
+        snapshots the config are picked up by it, and changes made during
+        its write make it save again. Without a loop it is written
+        immediately.
+        Every config change goes through here, so it also drops the cached
+        query reply.
+        """
+        self._config_payload = None
         if self.config.test_mode:
             logger.debug("Skipping config save in test mode")
             return
-        save_config(self.config, self.profile_name)
-        logger.info(f"Saved config with {len(self.config.rigs)} rigs")
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._write_config(self.config)
+            return
+        self._save_dirty = True
+        if self._save_task is None or self._save_task.done():
+            self._save_task = loop.create_task(self._save_later())
+    
+    async def _save_later(self):
+        """Write the config once the debounce window has passed.
+
+        Repeats while edits keep arriving during the write, so the last
+        change is always persisted.
+        """
+        while self._save_dirty:
+            await asyncio.sleep(SAVE_DELAY_S)
+            # Snapshot on the loop so later edits can't race the writer thread
+            self._save_dirty = False
+            snapshot = self.config.model_copy(deep=True)
+            await asyncio.to_thread(self._write_config, snapshot)
+    
+    async def flush(self):
+        """Wait for a pending debounced save to be written."""
+        task, self._save_task = self._save_task, None
+        if task is not None:
+            await task
+    
+    def _write_config(self, config: AppConfig):
+        save_config(config, self.profile_name)
+        logger.info(f"Saved config with {len(config.rigs)} rigs")
     
     def add_rig(self, rig_config: dict) -> bool:
         """Add a rig to the configuration.
@@ -86,8 +138,6 @@ class ConfigStore:
         Returns:
             True if rig was added, False if it already exists
         """
-        from multirig.config import RigConfig
-        
         rig = RigConfig(**rig_config)
         
         # Check if already exists
@@ -214,6 +264,8 @@ class ConfigStore:
         """Stop the config store."""
         logger.info("Stopping config store")
         
+        await self.flush()
+        
         if self._config_queryable:
             self._config_queryable.undeclare()
         if self._state_subscriber:
@@ -230,9 +282,10 @@ class ConfigStore:
             query: Zenoh query object
         """
         try:
-            # Return current config as JSON
-            config_dict = self.config.model_dump(exclude={"test_mode"})
-            query.reply(keys.CONFIG, serialize(config_dict))
+            # Return current config as JSON, encoded once per change
+            if self._config_payload is None:
+                self._config_payload = serialize(self.config.model_dump(exclude={"test_mode"}))
+            query.reply(keys.CONFIG, self._config_payload)
         except Exception as e:
             logger.error(f"Error handling config query: {e}")
     
@@ -12,7 +12,7 @@ from typing import Optional, Set
 from multirig.messages import RigState, RigCommand, SyncState
 from multirig.zenoh import keys
 from multirig.zenoh.session import get_session, Publisher, Subscriber
-from multirig.zenoh.serialization import deserialize
+from multirig.zenoh.serialization import deserialize, serialize
 
 logger = logging.getLogger(__name__)
 
@@ -269,7 +269,6 @@ class SyncEngine:
                 command_key = keys.rig_command_key(follower_id)
                 
                 for cmd in commands:
-                    from multirig.zenoh.serialization import serialize
                     session.put(command_key, serialize(cmd))
                     logger.debug(
                         f"Synced {cmd.command_type} from {self.source_rig_id} to {follower_id}"
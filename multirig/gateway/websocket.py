@@ -6,9 +6,14 @@ Streams rig state changes and sync updates to connected WebSocket clients.
 import asyncio
 import json
 import logging
-from typing import Set
+from typing import Dict, Optional, Set
 from fastapi import WebSocket, WebSocketDisconnect
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from multirig.zenoh import keys
 from multirig.zenoh.session import get_session, Subscriber
 from multirig.zenoh.serialization import deserialize
@@ -16,6 +21,16 @@ from multirig.messages import RigState, SyncState
 
 logger = logging.getLogger(__name__)
 
+# Window for coalescing bursts of updates; only the latest per topic is sent
+BROADCAST_COALESCE_S = 0.05
+
+
+def _dumps(message: dict) -> str:
+    """Encode a message as JSON text, using orjson when it is available."""
+    if orjson is not None:
+        return orjson.dumps(message).decode('utf-8')
+    return json.dumps(message)
+
 
 class WebSocketManager:
     """
@@ -30,6 +45,10 @@ class WebSocketManager:
         self._state_subscriber: Subscriber = None
         self._sync_subscriber: Subscriber = None
         self._started = False
+        
+        # Latest undelivered message per topic and the task that flushes them
+        self._pending: Dict[str, dict] = {}
+        self._flush_task: Optional[asyncio.Task] = None
     
     async def start(self):
         """Start subscribing to Zenoh topics."""
@@ -68,6 +87,11 @@ class WebSocketManager:
         if self._sync_subscriber:
             self._sync_subscriber.stop()
         
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        self._pending.clear()
+        
         # Close all connections
         for connection in list(self.active_connections):
             await connection.close()
@@ -109,7 +133,7 @@ class WebSocketManager:
                 }
             }
             
-            await self._broadcast(message)
+            self._queue(f"rig_state:{state.rig_id}", message)
             
         except Exception as e:
             logger.error(f"Error handling rig state in WebSocket manager: {e}")
@@ -134,35 +158,54 @@ class WebSocketManager:
                 }
             }
             
-            await self._broadcast(message)
+            self._queue("sync_state", message)
             
         except Exception as e:
             logger.error(f"Error handling sync state in WebSocket manager: {e}")
     
+    def _queue(self, topic: str, message: dict):
+        """Queue a message for broadcast, replacing any unsent one for the topic.
+        
+        Messages are flushed after BROADCAST_COALESCE_S, so a burst of
+        updates for one rig reaches clients as a single frame.
+        """
+        if not self.active_connections:
+            return
+        self._pending[topic] = message
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.get_running_loop().create_task(self._flush_later())
+    
+    async def _flush_later(self):
+        """Broadcast queued messages until none are left."""
+        while self._pending:
+            await asyncio.sleep(BROADCAST_COALESCE_S)
+            pending, self._pending = self._pending, {}
+            for message in pending.values():
+                await self._broadcast(message)
+    
     async def _broadcast(self, message: dict):
         """Broadcast a message to all connected clients."""
         if not self.active_connections:
             return
         
-        json_message = json.dumps(message)
+        # Encode once for every client
+        json_message = _dumps(message)
         
-        # Send to all clients, removing any that fail
-        disconnected = []
-        for connection in self.active_connections:
-            try:
-                await connection.send_text(json_message)
-            except Exception as e:
-                logger.error(f"Error sending to WebSocket client: {e}")
-                disconnected.append(connection)
-        
-        # Remove disconnected clients
-        for connection in disconnected:
-            self.disconnect(connection)
+        # Send to all clients concurrently, removing any that fail
+        connections = list(self.active_connections)
+        results = await asyncio.gather(
+            *(connection.send_text(json_message) for connection in connections),
+            return_exceptions=True,
+        )
+        for connection, result in zip(connections, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error sending to WebSocket client: {result}")
+                self.disconnect(connection)
     
     async def send_to_client(self, websocket: WebSocket, message: dict):
         """Send a message to a specific client."""
         try:
-            await websocket.send_json(message)
+            await websocket.send_text(_dumps(message))
         except Exception as e:
             logger.error(f"Error sending to WebSocket client: {e}")
             self.disconnect(websocket)
@@ -9,6 +9,11 @@ from typing import TypeVar, Type
 
 from pydantic import BaseModel
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 
 T = TypeVar('T')
 
@@ -31,13 +36,27 @@ def serialize(obj: object) -> bytes:
     if isinstance(obj, BaseModel):
         return obj.model_dump_json().encode('utf-8')
     elif is_dataclass(obj) and not isinstance(obj, type):
-        return json.dumps(asdict(obj)).encode('utf-8')
+        return _dumps(asdict(obj))
     elif isinstance(obj, dict):
-        return json.dumps(obj).encode('utf-8')
+        return _dumps(obj)
     else:
         raise TypeError(f"Cannot serialize {type(obj)}")
 
 
+def _dumps(data: dict) -> bytes:
+    """Encode a dict as JSON bytes, using orjson when it is available."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode('utf-8')
+
+
+def _loads(data: bytes) -> dict:
+    """Decode JSON bytes, using orjson when it is available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def deserialize(data: bytes, cls: Type[T]) -> T:
     """
     Deserialize JSON bytes to a typed object.
@@ -49,12 +68,10 @@ def deserialize(data: bytes, cls: Type[T]) -> T:
     Returns:
         Deserialized object
     """
-    json_str = data.decode('utf-8')
-    
     if issubclass(cls, BaseModel):
-        return cls.model_validate_json(json_str)
+        return cls.model_validate_json(data)
     elif is_dataclass(cls):
-        return cls(**json.loads(json_str))
+        return cls(**_loads(data))
     else:
         raise TypeError(f"Cannot deserialize to {cls}")
 
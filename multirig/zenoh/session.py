@@ -11,6 +11,8 @@ from typing import Callable, Optional
 
 import zenoh
 
+from .serialization import serialize
+
 logger = logging.getLogger(__name__)
 
 # Global session instance
@@ -103,8 +105,6 @@ class Publisher:
     
     def publish(self, data: object):
         """Publish serialized data to the key expression."""
-        from .serialization import serialize
-        
         self._ensure_publisher()
         payload = serialize(data)
         self._publisher.put(payload)
@@ -132,22 +132,28 @@ class Subscriber:
         self.callback = callback
         self._subscriber = None
         self._loop = None
+        # Strong references so scheduled callbacks aren't garbage collected
+        self._tasks: set = set()
     
     def start(self):
         """Start the subscriber."""
         session = get_session()
         self._loop = asyncio.get_event_loop()
-        
-        def sync_callback(sample):
-            # Schedule async callback on the event loop
-            if asyncio.iscoroutinefunction(self.callback):
-                self._loop.call_soon_threadsafe(
-                    lambda: asyncio.create_task(self.callback(sample))
-                )
-            else:
-                self.callback(sample)
-        
-        self._subscriber = session.declare_subscriber(self.key_expr, sync_callback)
+        # Resolve the dispatch once rather than per sample
+        if asyncio.iscoroutinefunction(self.callback):
+            handler = self._schedule
+        else:
+            handler = self.callback
+        self._subscriber = session.declare_subscriber(self.key_expr, handler)
+    
+    def _schedule(self, sample):
+        """Hand a sample from the Zenoh thread to the event loop."""
+        self._loop.call_soon_threadsafe(self._spawn, sample)
+    
+    def _spawn(self, sample):
+        task = self._loop.create_task(self.callback(sample))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
     
     def stop(self):
         """Stop the subscriber."""
@@ -23,61 +23,79 @@ from .router import MessageRouter
 from .debug_log import DebugStore
 from .profiles import ProfileManager
 from .routes import router
-from .core import bootstrap_active_profile, rebuild_rigs, _rigctl_bind_host, _rigctl_bind_port, AppRigctlServer
+from .core import bootstrap_active_profile, close_rigs, drain_rig_closes, flush_config_save, rebuild_rigs, _rigctl_bind_host, _rigctl_bind_port, AppRigctlServer
 from .rig import RigctlServerConfig
 
 BASE_DIR = Path(__file__).resolve().parent
 TEMPLATES_DIR = BASE_DIR / "templates"
 STATIC_DIR = BASE_DIR / "static"
 
+# Set once the static/template directories are known to exist, so repeated
+# create_app() calls (tests build many apps) skip the mkdir syscalls.
+_asset_dirs_ready = False
+
+
+def _ensure_asset_dirs() -> None:
+    """Create the static and template directories if they are missing."""
+    global _asset_dirs_ready
+    if _asset_dirs_ready:
+        return
+    for directory in (STATIC_DIR, TEMPLATES_DIR):
+        if not os.path.isdir(directory):
+            directory.mkdir(parents=True, exist_ok=True)
+    _asset_dirs_ready = True
+
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI):
+    """Build rigs and start background services for the app's lifetime."""
+    try:
+        # Initial async build of rigs
+        await rebuild_rigs(app, app.state.config)
+
+        # Wire rigs to router (router handles sync now)
+        app.state.router.set_rigs(app.state.rigs)
+
+        # Also wire to sync service for backward compatibility
+        app.state.sync_service.rigs = app.state.rigs
+
+        await bootstrap_active_profile(app)
+    except Exception: pass
+
+    # Start router (handles sync and status updates)
+    await app.state.router.start()
+
+    # Don't start SyncService - router handles sync now
+    # Keeping it instantiated for backward compatibility with code that
+    # accesses app.state.sync_service.enabled etc.
+    # await app.state.sync_service.start()
+
+    try:
+        await app.state.rigctl_server.start()
+    except Exception: pass
+
+    yield
+
+    # Shutdown
+    await app.state.router.stop()
+    try:
+        await flush_config_save(app)
+    except Exception: pass
+    # SyncService not started, no need to stop
+    # await app.state.sync_service.stop()
+    try:
+        await app.state.rigctl_server.stop()
+    except Exception: pass
+    await drain_rig_closes(app)
+    await close_rigs(getattr(app.state, "rigs", []))
+
+
 def create_app(config_path: Optional[Path] = None) -> FastAPI:
     """Create and configure the MultiRig FastAPI application."""
-    @asynccontextmanager
-    async def lifespan(app: FastAPI):
-        try:
-            # Initial async build of rigs
-            await rebuild_rigs(app, app.state.config)
-            
-            # Wire rigs to router (router handles sync now)
-            app.state.router.set_rigs(app.state.rigs)
-            
-            # Also wire to sync service for backward compatibility
-            app.state.sync_service.rigs = app.state.rigs
-
-            await bootstrap_active_profile(app)
-        except Exception: pass
-
-        # Start router (handles sync and status updates)
-        await app.state.router.start()
-        
-        # Don't start SyncService - router handles sync now
-        # Keeping it instantiated for backward compatibility with code that
-        # accesses app.state.sync_service.enabled etc.
-        # await app.state.sync_service.start()
-        
-        try:
-            await app.state.rigctl_server.start()
-        except Exception: pass
-        
-        yield
-        
-        # Shutdown
-        await app.state.router.stop()
-        # SyncService not started, no need to stop
-        # await app.state.sync_service.stop()
-        try:
-            await app.state.rigctl_server.stop()
-        except Exception: pass
-        for rig in getattr(app.state, "rigs", []):
-            try:
-                await rig.close()
-            except Exception: pass
-
-    app = FastAPI(title="MultiRig", version="0.1.0", default_response_class=ORJSONResponse, lifespan=lifespan)
+    app = FastAPI(title="MultiRig", version="0.1.0", default_response_class=ORJSONResponse, lifespan=_lifespan)
     app.add_middleware(GZipMiddleware, minimum_size=1000)
 
-    STATIC_DIR.mkdir(parents=True, exist_ok=True)
-    TEMPLATES_DIR.mkdir(parents=True, exist_ok=True)
+    _ensure_asset_dirs()
 
     app.mount("/static", StaticFiles(directory=str(STATIC_DIR)), name="static")
 
@@ -87,7 +105,18 @@ def create_app(config_path: Optional[Path] = None) -> FastAPI:
 
     app.state.config_path = config_path
     app.state.config = load_config(app.state.config_path)
+    app.state.config_json = None
+    app.state.config_yaml = None
+    app.state.config_dump = None
+    app.state.settings_html_cache = None
+    app.state.config_save_task = None
+    app.state.config_save_flush = None
+    app.state.config_save_gen = 0
+    app.state.config_save_lock = None
+    app.state.bind_addrs_pending = None
+    app.state.rig_close_tasks = set()
     app.state.profiles = ProfileManager(config_path, test_mode=app.state.config.test_mode)
+    # Always a stripped str; every writer stores a validated profile name or ""
     app.state.active_profile_name = app.state.profiles.get_active_name()
     
     
@@ -125,11 +154,18 @@ def create_app(config_path: Optional[Path] = None) -> FastAPI:
 
 def run():
     import uvicorn
+    # Let uvicorn drive uvloop/httptools itself rather than installing a
+    # global loop policy; fall back to the pure-Python stack when missing
+    try:
+        import uvloop  # noqa: F401
+        loop = "uvloop"
+    except ImportError:
+        loop = "asyncio"
     try:
-        import uvloop
-        uvloop.install()
+        import httptools  # noqa: F401
+        http = "httptools"
     except ImportError:
-        pass
+        http = "h11"
 
     port = int(os.getenv("MULTIRIG_HTTP_PORT", os.getenv("PORT", 8000)))
-    uvicorn.run(create_app(), host="0.0.0.0", port=port)
+    uvicorn.run(create_app(), host="0.0.0.0", port=port, loop=loop, http=http)
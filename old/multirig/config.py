@@ -1,11 +1,40 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
+from bisect import bisect_right
 import os
+import tempfile
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional, Literal, List, Any, Dict
+from typing import Optional, Literal, List, Any, Dict, Tuple
 
 import yaml
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, Field, PrivateAttr, model_validator
+
+
+# Prefer the libyaml-backed C loader/dumper; fall back to the pure-Python
+# safe implementations when PyYAML was built without libyaml.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+def load_yaml(text: str | bytes) -> Any:
+    """Parse YAML with the safe loader, using libyaml when available."""
+    return yaml.load(text, Loader=_YAML_LOADER)
+
+
+def dump_yaml(data: Any) -> str:
+    """Serialize data to YAML in insertion order, using libyaml when available."""
+    return yaml.dump(data, Dumper=_YAML_DUMPER, sort_keys=False)
+
+
+def dump_yaml_bytes(data: Any) -> bytes:
+    """Like :func:`dump_yaml`, but have the emitter write UTF-8 directly.
+
+    Skips building the full ``str`` only to encode a second copy of it.
+    """
+    return yaml.dump(data, Dumper=_YAML_DUMPER, sort_keys=False, encoding="utf-8")
 
 
 def _normalize_band_label(label: str) -> str:
@@ -76,6 +105,51 @@ def _band_limits(label: str) -> Optional[tuple[int, int]]:
     return int(d["lo"]), int(d["hi"])
 
 
+class BandRanges:
+    """Enabled band preset ranges merged into sorted, non-overlapping intervals.
+
+    Attributes:
+        lowers: Sorted lower bounds in Hz.
+        uppers: Upper bounds in Hz, matching ``lowers`` by index.
+        has_open: True if an enabled preset has no explicit range.
+    """
+
+    __slots__ = ("lowers", "uppers", "has_open")
+
+    def __init__(self, presets: List[BandPreset]):
+        spans: List[Tuple[int, int]] = []
+        has_open = False
+        for p in presets:
+            try:
+                if getattr(p, "enabled", True) is False:
+                    continue
+                lo = getattr(p, "lower_hz", None)
+                hi = getattr(p, "upper_hz", None)
+                if lo is None or hi is None:
+                    has_open = True
+                    continue
+                spans.append((int(lo), int(hi)))
+            except Exception:
+                continue
+        spans.sort()
+        lowers: List[int] = []
+        uppers: List[int] = []
+        for lo, hi in spans:
+            if uppers and lo <= uppers[-1]:
+                uppers[-1] = max(uppers[-1], hi)
+            else:
+                lowers.append(lo)
+                uppers.append(hi)
+        self.lowers: Tuple[int, ...] = tuple(lowers)
+        self.uppers: Tuple[int, ...] = tuple(uppers)
+        self.has_open = has_open
+
+    def contains(self, hz: int) -> bool:
+        """Return True if ``hz`` falls inside one of the explicit ranges."""
+        i = bisect_right(self.lowers, hz) - 1
+        return i >= 0 and hz <= self.uppers[i]
+
+
 def _all_band_definitions() -> List[Dict[str, Any]]:
     """Return all known amateur radio band definitions."""
     return [{**d} for d in _BAND_DEFINITIONS]
@@ -197,6 +271,31 @@ class RigConfig(BaseModel):
     color: str = Field(default="#a4c356", description="Primary color for the rig UI")
     inverted: bool = Field(default=False, description="Invert LCD colors (dark mode style)")
 
+    _band_ranges: Optional[Tuple[List[BandPreset], BandRanges]] = PrivateAttr(default=None)
+
+    def band_ranges(self) -> BandRanges:
+        """Return the enabled band preset ranges, compiled for lookup.
+
+        The result is cached against the ``band_presets`` list and rebuilt
+        when a new list is assigned, as happens when a config is applied.
+        """
+        cached = self._band_ranges
+        if cached is None or cached[0] is not self.band_presets:
+            cached = (self.band_presets, BandRanges(self.band_presets))
+            self._band_ranges = cached
+        return cached[1]
+
+    def connection_key(self) -> Tuple[Any, ...]:
+        """Return the fields that determine how a client reaches this rig.
+
+        These are exactly the fields ``RigClient`` builds its backend from;
+        rigs with equal keys can share a client and its open connection.
+        """
+        return (
+            self.managed, self.connection_type, self.host, self.port,
+            self.model_id, self.device, self.baud, self.serial_opts, self.extra_args,
+        )
+
 
 class AppConfig(BaseModel):
     """Top-level application configuration.
@@ -225,6 +324,9 @@ class AppConfig(BaseModel):
 def _migrate_config(data: Dict[str, Any]) -> Dict[str, Any]:
     """Migrate legacy config with `rig_a`/`rig_b` to the list-based format.
 
+    A mapping that already has `rigs` is returned unchanged (same object, no
+    copy), so current-schema configs cost a single key lookup.
+
     Args:
         data: Raw config mapping parsed from YAML.
 
@@ -254,12 +356,94 @@ def _migrate_config(data: Dict[str, Any]) -> Dict[str, Any]:
     return migrated
 
 
+# Parsed configs keyed by path, validated against the file's (mtime_ns, size).
+# Stored as JSON: pydantic-core validates it back into a fresh model much
+# faster than a Python-level deep copy of the model tree.
+# Kept in LRU order and bounded so long-running test sessions stay small.
+_CONFIG_CACHE_MAX = 100
+_config_cache: "OrderedDict[str, Tuple[int, int, bytes]]" = OrderedDict()
+
+
+def _clear_config_cache(path: Optional[Path] = None) -> None:
+    """Drop one cached config, or all of them when `path` is None."""
+    if path is None:
+        _config_cache.clear()
+    else:
+        _config_cache.pop(str(path), None)
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Replace ``path`` with ``data`` via a uniquely named temporary file.
+
+    Each writer gets its own temporary file in the same directory, so
+    concurrent writers cannot clobber each other's half-written output.
+    """
+    with tempfile.NamedTemporaryFile(dir=path.parent, prefix=path.name + ".", suffix=".tmp", delete=False) as f:
+        tmp = f.name
+        try:
+            f.write(data)
+        except BaseException:
+            f.close()
+            os.unlink(tmp)
+            raise
+    try:
+        # NamedTemporaryFile creates files 0600; keep configs readable as before
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, path)
+    except BaseException:
+        try: os.unlink(tmp)
+        except OSError: pass
+        raise
+
+
+def _sidecar_path(path: Path) -> Path:
+    """Return the JSON cache file stored next to a YAML config."""
+    return path.with_name(path.name + ".cache.json")
+
+
+def _yaml_digest(yaml_bytes: bytes) -> bytes:
+    return hashlib.blake2b(yaml_bytes, digest_size=16).hexdigest().encode("ascii")
+
+
+def _read_sidecar(path: Path, yaml_bytes: bytes) -> Optional[bytes]:
+    """Load the JSON cache for `path` if it was produced from `yaml_bytes`.
+
+    The sidecar's first line is a digest of the YAML it was generated from;
+    the rest is the config as JSON, which is returned. Returns None when
+    the sidecar is missing or stale, in which case the YAML must be parsed.
+    """
+    try:
+        digest, _, body = _sidecar_path(path).read_bytes().partition(b"\n")
+    except OSError:
+        return None
+    if digest != _yaml_digest(yaml_bytes):
+        return None
+    return body
+
+
+def _write_sidecar(path: Path, yaml_bytes: bytes, body: bytes) -> None:
+    """Atomically (re)write the JSON cache for the YAML config at `path`.
+
+    The cache is an optimization only, so write failures are ignored.
+    """
+    try:
+        atomic_write_bytes(_sidecar_path(path), _yaml_digest(yaml_bytes) + b"\n" + body)
+    except OSError:
+        pass
+
+
 def load_config(path: Path) -> AppConfig:
     """Load configuration from disk and apply schema migration.
 
     The `test_mode` flag is derived from the `MULTIRIG_TEST_MODE` environment
     variable.
 
+    Parsed configs are cached per path and reused while the file's mtime and
+    size are unchanged; callers always get their own instance and may
+    mutate it freely. Across restarts, a JSON sidecar written next to the
+    YAML (see `save_config`) is preferred over re-parsing the YAML when its
+    embedded digest still matches.
+
     Args:
         path: Path to the main YAML config.
 
@@ -267,14 +451,43 @@ def load_config(path: Path) -> AppConfig:
         A validated `AppConfig` instance.
     """
     test_mode = os.getenv("MULTIRIG_TEST_MODE") == "1"
-    if path.exists():
-        raw = yaml.safe_load(path.read_text()) or {}
-        data = _migrate_config(raw)
-        cfg = AppConfig.model_validate(data)
-        cfg.test_mode = test_mode
-        # If migration happened (legacy keys), write back in new shape
-        if "rigs" in data and ("rig_a" in raw or "rig_b" in raw):
-            save_config(cfg, path)
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        st = None
+    if st is not None:
+        key = str(path)
+        cached = _config_cache.get(key)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            _config_cache.move_to_end(key)
+            cfg = AppConfig.model_validate_json(cached[2])
+            cfg.test_mode = test_mode
+            return cfg
+        yaml_bytes = path.read_bytes()
+        cfg = None
+        body = _read_sidecar(path, yaml_bytes)
+        if body is not None:
+            try:
+                cfg = AppConfig.model_validate_json(body)
+                cfg.test_mode = test_mode
+            except ValueError:
+                cfg = None
+        if cfg is None:
+            raw = load_yaml(yaml_bytes) or {}
+            data = _migrate_config(raw)
+            cfg = AppConfig.model_validate(data)
+            cfg.test_mode = test_mode
+            body = cfg.model_dump_json().encode("utf-8")
+            # If migration happened (legacy keys), write back in new shape
+            if "rigs" in data and ("rig_a" in raw or "rig_b" in raw):
+                save_config(cfg, path)
+                st = path.stat()
+            elif not test_mode:
+                _write_sidecar(path, yaml_bytes, body)
+        _config_cache[key] = (st.st_mtime_ns, st.st_size, body)
+        _config_cache.move_to_end(key)
+        while len(_config_cache) > _CONFIG_CACHE_MAX:
+            _config_cache.popitem(last=False)
         return cfg
     cfg = AppConfig()
     cfg.test_mode = test_mode
@@ -287,10 +500,39 @@ def save_config(cfg: AppConfig, path: Path) -> None:
 
     In `test_mode`, this is a no-op.
 
+    The JSON sidecar cache next to the YAML is refreshed as well.
+
+    Args:
+        cfg: Configuration to save.
+        path: Path to write YAML to.
+    """
+    if cfg.test_mode:
+        return
+    _write_config_files(path, cfg.model_dump(), cfg.model_dump_json().encode("utf-8"))
+
+
+async def save_config_async(cfg: AppConfig, path: Path) -> None:
+    """Persist configuration without blocking the event loop.
+
+    The model is dumped on the calling thread, so later in-place edits to
+    `cfg` cannot race the write; YAML encoding and file I/O run in a
+    worker thread.
+
     Args:
         cfg: Configuration to save.
         path: Path to write YAML to.
     """
     if cfg.test_mode:
         return
-    path.write_text(yaml.safe_dump(cfg.model_dump(), sort_keys=False))
+    data = cfg.model_dump()
+    body = cfg.model_dump_json().encode("utf-8")
+    await asyncio.to_thread(_write_config_files, path, data, body)
+
+
+def _write_config_files(path: Path, data: Dict[str, Any], body: bytes) -> None:
+    """Write the YAML config atomically, then refresh its JSON sidecar."""
+    yaml_bytes = dump_yaml_bytes(data)
+    # Readers never see a half-written file
+    atomic_write_bytes(path, yaml_bytes)
+    _clear_config_cache(path)
+    _write_sidecar(path, yaml_bytes, body)
@@ -2,10 +2,10 @@ from __future__ import annotations
 import asyncio
 import os
 import re
-from typing import Optional, List, Any, Sequence, TYPE_CHECKING
+from typing import Optional, Dict, List, Any, Sequence, Tuple, TYPE_CHECKING
 
 from fastapi import FastAPI
-from .config import AppConfig, save_config
+from .config import AppConfig, _migrate_config, save_config_async
 from .rig import RigClient, RigctlServer, RigctlServerConfig
 from .profiles import ProfileManager
 
@@ -36,28 +36,114 @@ class AppRigctlServer(RigctlServer):
     def get_sync_enabled(self) -> bool:
         return self.app.state.config.sync_enabled
 
+def _env_int(name: str) -> Optional[int]:
+    value = os.getenv(name)
+    try: return int(value) if value else None
+    except ValueError: return None
+
+# Environment overrides for the rigctl listener, resolved once at import
+# rather than on every server (re)build
+_ENV_RIGCTL_HOST: Optional[str] = os.getenv("MULTIRIG_RIGCTL_HOST")
+_ENV_RIGCTL_PORT: Optional[int] = _env_int("MULTIRIG_RIGCTL_PORT")
+
 def _rigctl_bind_host(app: FastAPI) -> str:
-    return os.getenv("MULTIRIG_RIGCTL_HOST", app.state.config.rigctl_listen_host)
+    return _ENV_RIGCTL_HOST if _ENV_RIGCTL_HOST is not None else app.state.config.rigctl_listen_host
 
 def _rigctl_bind_port(app: FastAPI) -> int:
-    port_s = os.getenv("MULTIRIG_RIGCTL_PORT")
-    try: return int(port_s) if port_s else app.state.config.rigctl_listen_port
-    except Exception: return app.state.config.rigctl_listen_port
+    return _ENV_RIGCTL_PORT if _ENV_RIGCTL_PORT is not None else app.state.config.rigctl_listen_port
+
+# Upper bound on one batch of rig closes, so a wedged backend cannot stall
+# a rebuild or shutdown
+RIG_CLOSE_TIMEOUT_S = 2.0
+
+async def close_rigs(rigs: Sequence[RigClient], timeout: Optional[float] = None) -> None:
+    """Close rig clients concurrently, ignoring individual close failures.
+
+    A backend that is slow to time out no longer delays closing the others,
+    and the whole batch is abandoned after ``timeout`` seconds (default
+    ``RIG_CLOSE_TIMEOUT_S``).
+    """
+    if not rigs:
+        return
+    try:
+        await asyncio.wait_for(
+            asyncio.gather(*(rig.close() for rig in rigs), return_exceptions=True),
+            RIG_CLOSE_TIMEOUT_S if timeout is None else timeout,
+        )
+    except asyncio.TimeoutError:
+        pass
+
+def schedule_rig_close(app: FastAPI, rigs: Sequence[RigClient]) -> None:
+    """Close rigs in the background, keeping a reference to the task.
+
+    The task is tracked in ``app.state.rig_close_tasks`` so it cannot be
+    garbage collected mid-close and shutdown can wait for it.
+    """
+    tasks = app.state.rig_close_tasks
+    task = asyncio.create_task(close_rigs(list(rigs)))
+    tasks.add(task)
+    task.add_done_callback(tasks.discard)
+
+async def drain_rig_closes(app: FastAPI) -> None:
+    """Wait for background rig closes started by :func:`schedule_rig_close`."""
+    tasks = getattr(app.state, "rig_close_tasks", None)
+    if tasks:
+        await asyncio.gather(*list(tasks), return_exceptions=True)
 
 async def rebuild_rigs(app: FastAPI, cfg: AppConfig):
-    # Close existing
-    for rig in getattr(app.state, "rigs", []):
-        try:
-            await rig.close()
-        except Exception:
-            pass
+    """Bring ``app.state.rigs`` in line with ``cfg.rigs``.
+
+    Rigs are matched by their full config first, so reordering or removing
+    one rig does not disturb the others. Remaining rigs are then matched by
+    :meth:`RigConfig.connection_key`, so editing a name, colour, preset or
+    enabled flag keeps the client (and open connection) too. Only rigs whose
+    connection changed, or that were removed, are closed, and only those or
+    added rigs get a new client.
+    """
+    old_rigs: List[RigClient] = list(getattr(app.state, "rigs", []))
+    free = set(range(len(old_rigs)))
+    by_cfg: Dict[str, List[int]] = {}
+    for i, old in enumerate(old_rigs):
+        by_cfg.setdefault(old.cfg.model_dump_json(), []).append(i)
+    rigs: List[Optional[RigClient]] = [None] * len(cfg.rigs)
+    for j, rc in enumerate(cfg.rigs):
+        matches = by_cfg.get(rc.model_dump_json())
+        if matches:
+            i = matches.pop(0)
+            free.discard(i)
+            rigs[j] = old_rigs[i]
+    by_conn: Dict[Tuple[Any, ...], List[int]] = {}
+    for i in sorted(free):
+        by_conn.setdefault(old_rigs[i].cfg.connection_key(), []).append(i)
+    to_close: List[RigClient] = []
+    for j, rc in enumerate(cfg.rigs):
+        rig = rigs[j]
+        if rig is None:
+            matches = by_conn.get(rc.connection_key())
+            if not matches:
+                rigs[j] = RigClient(rc)
+                continue
+            i = matches.pop(0)
+            free.discard(i)
+            rig = rigs[j] = old_rigs[i]
+            if rig.cfg.enabled and not rc.enabled:
+                # Same as toggling the rig off: drop its connection
+                to_close.append(rig)
+        # Point at the new config object so in-place edits stay in sync
+        rig.cfg = rc
+    to_close.extend(old_rigs[i] for i in sorted(free))
+    await close_rigs(to_close)
     
-    app.state.rigs = [RigClient(rc) for rc in cfg.rigs]
+    app.state.rigs = rigs
     app.state.debug.ensure_rigs(len(app.state.rigs))
     for idx, rig in enumerate(app.state.rigs):
         log = app.state.debug.rig(idx)
         if log:
-            try: setattr(rig._backend, "_debug", log)
+            backend = getattr(rig, "_backend", None)
+            if getattr(backend, "_debug", None) is log:
+                # Kept rig at the same index; already attached
+                continue
+            try: setattr(backend, "_debug", log)
             except Exception: pass
     
     # Update router with new rigs
@@ -68,15 +154,31 @@ async def rebuild_rigs(app: FastAPI, cfg: AppConfig):
     return app.state.rigs
 
 async def restart_rigctl_server(app: FastAPI, start: bool = True) -> None:
-    try: await app.state.rigctl_server.stop()
-    except Exception: pass
-    
+    current = getattr(app.state, "rigctl_server", None)
+    host, port = _rigctl_bind_host(app), _rigctl_bind_port(app)
+    if (
+        current is not None
+        and (current.host, current.port) == (host, port)
+        and bool(getattr(current, "running", False)) == start
+    ):
+        # Same listen address and already in the requested state: keep the
+        # listener (and connected clients such as WSJT-X) as they are
+        return
     # Get router if available
     router = getattr(app.state, "router", None)
     
+    if current is not None and hasattr(current, "reconfigure") and getattr(current, "_router", None) is router:
+        # Rebind the existing server rather than building a new one
+        try: await current.reconfigure(host, port, start)
+        except Exception: pass
+        return
+    
+    try: await app.state.rigctl_server.stop()
+    except Exception: pass
+    
     app.state.rigctl_server = AppRigctlServer(
         fastapi_app=app,
-        config=RigctlServerConfig(host=_rigctl_bind_host(app), port=_rigctl_bind_port(app)),
+        config=RigctlServerConfig(host=host, port=port),
         debug=app.state.debug.server,
         router=router,
     )
@@ -84,10 +186,97 @@ async def restart_rigctl_server(app: FastAPI, start: bool = True) -> None:
         try: await app.state.rigctl_server.start()
         except Exception: pass
 
+def invalidate_config_cache(app: FastAPI) -> None:
+    """Drop the cached serialized config after ``app.state.config`` changes.
+
+    ``GET /api/config`` and the YAML export serve pre-encoded bytes and the
+    settings page caches its rendered HTML; anything that replaces or
+    mutates the active config must call this so the next read re-encodes.
+    """
+    app.state.config_json = None
+    app.state.config_yaml = None
+    app.state.config_dump = None
+    app.state.settings_html_cache = None
+    # Rig status carries per-rig config flags (enabled, follow_main, ...)
+    router = getattr(app.state, "router", None)
+    if router is not None:
+        router.invalidate_status()
+
+def config_dump(app: FastAPI) -> Dict[str, Any]:
+    """Return ``app.state.config.model_dump()``, cached until the config changes.
+
+    The dict is shared between callers, so treat it as read-only.
+    """
+    dump = getattr(app.state, "config_dump", None)
+    if dump is None:
+        dump = app.state.config.model_dump()
+        app.state.config_dump = dump
+    return dump
+
+# Quiet period before a debounced config save hits the disk
+CONFIG_SAVE_DELAY_S = 0.2
+
+def _config_save_lock(app: FastAPI) -> asyncio.Lock:
+    """Return the lock serializing config file writes, creating it on first use."""
+    lock = getattr(app.state, "config_save_lock", None)
+    if lock is None:
+        lock = app.state.config_save_lock = asyncio.Lock()
+    return lock
+
+async def save_app_config(app: FastAPI, cfg: AppConfig) -> None:
+    """Write ``cfg`` to the app's config path, one writer at a time."""
+    async with _config_save_lock(app):
+        await save_config_async(cfg, app.state.config_path)
+
+def schedule_config_save(app: FastAPI, delay: float = CONFIG_SAVE_DELAY_S) -> None:
+    """Save the active config after ``delay`` seconds, coalescing bursts.
+
+    Toggle endpoints can be hit repeatedly; each full save is a YAML dump plus
+    a file write. Every call bumps ``app.state.config_save_gen``; a pending
+    save picks up changes made before it fires, and if the generation moved
+    while it was writing, it waits out another delay and saves again.
+    """
+    app.state.config_save_gen = getattr(app.state, "config_save_gen", 0) + 1
+    task = getattr(app.state, "config_save_task", None)
+    if task is not None and not task.done():
+        return
+    flush_now = asyncio.Event()
+
+    async def _save_later() -> None:
+        while True:
+            try:
+                await asyncio.wait_for(flush_now.wait(), delay)
+            except asyncio.TimeoutError:
+                pass
+            gen = app.state.config_save_gen
+            await save_app_config(app, app.state.config)
+            # No await between this check and returning, so a change that
+            # lands after it sees a finished task and schedules a new one
+            if app.state.config_save_gen == gen:
+                return
+
+    app.state.config_save_flush = flush_now
+    app.state.config_save_task = asyncio.create_task(_save_later())
+
+async def flush_config_save(app: FastAPI) -> None:
+    """Write a pending debounced config save immediately (used at shutdown).
+
+    The pending task is told to skip the rest of its delay and awaited,
+    rather than cancelled: cancelling it mid-write would leave its worker
+    thread writing while a second save starts.
+    """
+    task = getattr(app.state, "config_save_task", None)
+    app.state.config_save_task = None
+    if task is None or task.done():
+        return
+    app.state.config_save_flush.set()
+    await task
+
 async def apply_config(app: FastAPI, cfg: AppConfig, restart_rigctl: bool = True):
     cfg.test_mode = getattr(app.state.config, "test_mode", False)
     app.state.config = cfg
-    save_config(cfg, app.state.config_path)
+    invalidate_config_cache(app)
+    await save_app_config(app, cfg)
 
     await rebuild_rigs(app, cfg)
     
@@ -107,30 +296,48 @@ async def apply_config(app: FastAPI, cfg: AppConfig, restart_rigctl: bool = True
     try: app.state.sync_service._last = (None, None, None)
     except Exception: pass
     
-    await app.state.sync_service.stop()
-    await app.state.sync_service.start()
+    # Don't start SyncService - the router's poll loop is the single status
+    # producer and handles sync; a second loop would double the rig polling
     await restart_rigctl_server(app, start=restart_rigctl)
 
-def ensure_default_profile(app: FastAPI) -> None:
-    names = app.state.profiles.list_names()
+def _pick_active_profile(profiles: ProfileManager, active: str, dump: Dict[str, Any]) -> str:
+    """Blocking half of :func:`ensure_default_profile`; runs in a worker thread.
+
+    Creates a "Default" profile from ``dump`` when none exist and persists
+    the chosen name if it differs from ``active``.
+
+    Returns:
+        The profile name that should be active.
+    """
+    names = profiles.list_names()
     if names:
-        active = str(getattr(app.state, "active_profile_name", "") or "").strip()
-        if not active or active not in names:
-            app.state.active_profile_name = names[0]
-            app.state.profiles.persist_active_name(app.state.active_profile_name)
-        return
-    if not app.state.profiles.exists("Default"):
-        app.state.profiles.save_data("Default", app.state.config.model_dump())
-    app.state.active_profile_name = "Default"
-    app.state.profiles.persist_active_name(app.state.active_profile_name)
+        if active and active in names:
+            return active
+        profiles.persist_active_name(names[0])
+        return names[0]
+    if not profiles.exists("Default"):
+        profiles.save_data("Default", dump)
+    profiles.persist_active_name("Default")
+    return "Default"
+
+async def ensure_default_profile(app: FastAPI) -> None:
+    """Make sure a profile exists and one is marked active.
+
+    File I/O runs in a worker thread; ``app.state`` is only touched here on
+    the event loop.
+    """
+    active = app.state.active_profile_name
+    name = await asyncio.to_thread(_pick_active_profile, app.state.profiles, active, config_dump(app))
+    # Don't clobber a profile another request made active meanwhile
+    if app.state.active_profile_name == active:
+        app.state.active_profile_name = name
 
 async def bootstrap_active_profile(app: FastAPI) -> None:
-    ensure_default_profile(app)
-    name = str(getattr(app.state, "active_profile_name", "") or "").strip()
+    await ensure_default_profile(app)
+    name = app.state.active_profile_name
     if not name: return
     try:
-        data = app.state.profiles.load_data(name)
-        from .config import _migrate_config
+        data = await asyncio.to_thread(app.state.profiles.load_data, name)
         cfg = AppConfig.model_validate(_migrate_config(data))
         await apply_config(app, cfg, restart_rigctl=False)
     except Exception: pass
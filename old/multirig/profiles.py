@@ -1,9 +1,63 @@
 from __future__ import annotations
 
+import copy
+import json
+import os
 import re
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Any
-import yaml
+from typing import List, Dict, Any, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from .config import _read_sidecar, _sidecar_path, _write_sidecar, atomic_write_bytes, dump_yaml_bytes, load_yaml
+
+# Profile names double as file names; at most 100 characters
+_VALID_NAME_RE = re.compile(r"[A-Za-z0-9_.-]{1,100}")
+
+
+@lru_cache(maxsize=256)
+def _is_valid_profile_name(name: str) -> bool:
+    """Memoized profile-name check; a session reuses a handful of names."""
+    return _VALID_NAME_RE.fullmatch(name) is not None
+
+
+def _json_loads(body: bytes) -> Any:
+    return orjson.loads(body) if orjson is not None else json.loads(body)
+
+
+def _encode_profile(data: Dict[str, Any]) -> Optional[bytes]:
+    """Encode a profile for its JSON sidecar.
+
+    Returns None when JSON cannot represent the data exactly (non-string
+    keys, dates and the like), in which case the profile gets no sidecar.
+    """
+    try:
+        body = orjson.dumps(data) if orjson is not None else json.dumps(data).encode("utf-8")
+    except (TypeError, ValueError):
+        return None
+    return body if _json_loads(body) == data else None
+
+
+# Parsed profiles kept per manager, validated by the file's (mtime_ns, size)
+_PROFILE_CACHE_MAX = 32
+
+
+@lru_cache(maxsize=32)
+def _read_active_name(path: str, mtime_ns: int, size: int) -> str:
+    """Read the active-profile file.
+
+    Memoized on the file's mtime and size, so repeated lookups (every app
+    instance in the test suite, for example) cost a single stat() and
+    rewriting the file naturally invalidates the entry.
+    """
+    return Path(path).read_text().strip()
+
 
 class ProfileManager:
     """Encapsulates profile storage and management logic."""
@@ -13,10 +67,54 @@ class ProfileManager:
         self.profiles_dir = config_path.parent / "multirig.config.profiles"
         self.active_profile_path = config_path.parent / "multirig.config.active_profile"
         self._memory_store: Dict[str, Dict[str, Any]] = {}
+        # Parsed profiles as path -> [mtime_ns, size, data, exported YAML or None]
+        self._cache: "OrderedDict[str, List[Any]]" = OrderedDict()
+        # Profile files on disk as (profiles dir, dir mtime_ns, {name: file name})
+        self._files: Optional[Tuple[Path, int, Dict[str, str]]] = None
+        # Routes call into the manager from concurrent worker threads; guards
+        # the caches above (file I/O happens outside it)
+        self._lock = threading.Lock()
+
+    def _forget(self, name: str) -> None:
+        """Drop cached data for a profile after writing, renaming or deleting it."""
+        with self._lock:
+            for ext in ("yaml", "yml"):
+                self._cache.pop(str(self.profiles_dir / f"{name}.{ext}"), None)
+            self._files = None
+
+    def _disk_files(self) -> Dict[str, str]:
+        """Map each profile name on disk to its file name (.yaml preferred).
+
+        The directory is rescanned only when its mtime changes (a file was
+        added, removed or renamed); our own writes drop the cache as well.
+        """
+        directory = self.profiles_dir
+        try:
+            mtime_ns = os.stat(directory).st_mtime_ns
+        except FileNotFoundError:
+            return {}
+        with self._lock:
+            cached = self._files
+        if cached is not None and cached[0] == directory and cached[1] == mtime_ns:
+            return cached[2]
+        files: Dict[str, str] = {}
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                # DirEntry.is_file() uses the d_type from the scan, no extra stat
+                if entry.name.endswith((".yaml", ".yml")) and entry.is_file():
+                    stem, ext = entry.name.rsplit(".", 1)
+                    if ext == "yaml" or stem not in files:
+                        files[stem] = entry.name
+        with self._lock:
+            self._files = (directory, mtime_ns, files)
+        return files
 
     def persist_active_name(self, name: str) -> None:
         """Persist the active profile name to disk.
 
+        Rewriting the name that is already stored is skipped, and new names
+        are written to a temporary file and renamed into place.
+
         Args:
             name: The name of the profile to save as active.
         """
@@ -25,7 +123,8 @@ class ProfileManager:
             if not name:
                 if self.active_profile_path.exists(): self.active_profile_path.unlink()
                 return
-            self.active_profile_path.write_text(name)
+            if self.get_active_name() == name: return
+            atomic_write_bytes(self.active_profile_path, name.encode("utf-8"))
         except Exception: pass
 
     def get_active_name(self) -> str:
@@ -35,8 +134,8 @@ class ProfileManager:
             The name of the active profile, or an empty string if none is set.
         """
         try:
-            if self.active_profile_path.exists():
-                return self.active_profile_path.read_text().strip()
+            st = os.stat(self.active_profile_path)
+            return _read_active_name(str(self.active_profile_path), st.st_mtime_ns, st.st_size)
         except Exception: pass
         return ""
 
@@ -47,9 +146,7 @@ class ProfileManager:
             A sorted list of profile names available in storage.
         """
         if self.test_mode: return sorted(list(self._memory_store.keys()))
-        if not self.profiles_dir.exists(): return []
-        names = {p.stem for p in self.profiles_dir.glob("*.y*ml") if p.is_file()}
-        return sorted(list(names))
+        return sorted(self._disk_files())
 
     def exists(self, name: str) -> bool:
         """Check if a profile exists.
@@ -61,7 +158,7 @@ class ProfileManager:
             True if the profile exists, False otherwise.
         """
         if self.test_mode: return name in self._memory_store
-        return (self.profiles_dir / f"{name}.yaml").exists() or (self.profiles_dir / f"{name}.yml").exists()
+        return name in self._disk_files()
 
     def load_data(self, name: str) -> Dict[str, Any]:
         """Load profile data by name.
@@ -79,12 +176,67 @@ class ProfileManager:
         if self.test_mode:
             if name not in self._memory_store: raise FileNotFoundError(name)
             return self._memory_store[name]
-        p1, p2 = self.profiles_dir / f"{name}.yaml", self.profiles_dir / f"{name}.yml"
-        path = p1 if p1.exists() else p2
-        if not path.exists(): raise FileNotFoundError(name)
-        raw = yaml.safe_load(path.read_text()) or {}
-        if not isinstance(raw, dict): raise ValueError("invalid profile")
-        return raw
+        # Unchanged files are served from the cache; callers get their own copy
+        return copy.deepcopy(self._cached(name)[2])
+
+    def export_yaml(self, name: str) -> bytes:
+        """Return a profile serialized as YAML.
+
+        The dump is kept with the parsed profile, so repeat exports of an
+        unchanged file skip both the copy and the serialization.
+
+        Args:
+            name: The name of the profile to export.
+
+        Returns:
+            The profile as UTF-8 encoded YAML.
+
+        Raises:
+            FileNotFoundError: If the profile does not exist.
+            ValueError: If the profile data is invalid.
+        """
+        if self.test_mode:
+            return dump_yaml_bytes(self.load_data(name))
+        entry = self._cached(name)
+        if entry[3] is None:
+            entry[3] = dump_yaml_bytes(entry[2])
+        return entry[3]
+
+    def _cached(self, name: str) -> List[Any]:
+        """Return the cache entry for a profile, parsing the file if it changed."""
+        for path in (self.profiles_dir / f"{name}.yaml", self.profiles_dir / f"{name}.yml"):
+            try:
+                st = path.stat()
+                break
+            except FileNotFoundError:
+                continue
+        else:
+            raise FileNotFoundError(name)
+        key = str(path)
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                self._cache.move_to_end(key)
+                return cached
+        # A JSON sidecar made from these exact YAML bytes skips the YAML parse
+        yaml_bytes = path.read_bytes()
+        body = _read_sidecar(path, yaml_bytes)
+        raw = None
+        if body is not None:
+            try: raw = _json_loads(body)
+            except ValueError: raw = None
+        if not isinstance(raw, dict):
+            raw = load_yaml(yaml_bytes) or {}
+            if not isinstance(raw, dict): raise ValueError("invalid profile")
+            body = _encode_profile(raw)
+            if body is not None: _write_sidecar(path, yaml_bytes, body)
+        cached = [st.st_mtime_ns, st.st_size, raw, None]
+        with self._lock:
+            self._cache[key] = cached
+            self._cache.move_to_end(key)
+            while len(self._cache) > _PROFILE_CACHE_MAX:
+                self._cache.popitem(last=False)
+        return cached
 
     def save_data(self, name: str, data: Dict[str, Any]) -> None:
         """Save configuration data to a profile.
@@ -96,8 +248,14 @@ class ProfileManager:
         if self.test_mode:
             self._memory_store[name] = data
             return
+        self._forget(name)
         self.profiles_dir.mkdir(parents=True, exist_ok=True)
-        (self.profiles_dir / f"{name}.yaml").write_text(yaml.safe_dump(data, sort_keys=False))
+        path = self.profiles_dir / f"{name}.yaml"
+        yaml_bytes = dump_yaml_bytes(data)
+        # Concurrent readers see the old or the new profile, never a partial one
+        atomic_write_bytes(path, yaml_bytes)
+        body = _encode_profile(data)
+        if body is not None: _write_sidecar(path, yaml_bytes, body)
 
     def delete(self, name: str) -> bool:
         """Delete a profile.
@@ -113,6 +271,7 @@ class ProfileManager:
                 del self._memory_store[name]
                 return True
             return False
+        self._forget(name)
         removed = False
         for ext in ("yaml", "yml"):
             p = self.profiles_dir / f"{name}.{ext}"
@@ -121,6 +280,8 @@ class ProfileManager:
                     p.unlink()
                     removed = True
                 except Exception: pass
+            try: _sidecar_path(p).unlink()
+            except OSError: pass
         return removed
 
     def rename(self, old_name: str, new_name: str) -> None:
@@ -129,15 +290,19 @@ class ProfileManager:
             if new_name in self._memory_store: raise FileExistsError(new_name)
             self._memory_store[new_name] = self._memory_store.pop(old_name)
             return
-        p1, p2 = self.profiles_dir / f"{old_name}.yaml", self.profiles_dir / f"{old_name}.yml"
-        src = p1 if p1.exists() else p2
-        if not src.exists(): raise FileNotFoundError(old_name)
+        files = self._disk_files()
+        if old_name not in files: raise FileNotFoundError(old_name)
+        src = self.profiles_dir / files[old_name]
         dst = self.profiles_dir / f"{new_name}{src.suffix}"
-        if dst.exists() or (self.profiles_dir / f"{new_name}.yaml").exists() or (self.profiles_dir / f"{new_name}.yml").exists():
+        # The explicit probe guards the rename itself, which would overwrite
+        if new_name in files or dst.exists():
             raise FileExistsError(new_name)
-        self.profiles_dir.mkdir(parents=True, exist_ok=True)
+        self._forget(old_name)
+        self._forget(new_name)
         src.rename(dst)
+        # The sidecar is keyed on the YAML content, so it stays valid
+        try: os.replace(_sidecar_path(src), _sidecar_path(dst))
+        except OSError: pass
 
     def is_valid_name(self, name: str) -> bool:
-        if not name or len(name) > 100: return False
-        return re.fullmatch(r"[A-Za-z0-9_.-]+", name) is not None
+        return _is_valid_profile_name(name or "")
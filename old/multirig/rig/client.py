@@ -37,6 +37,9 @@ class RigClient:
         self._check_caps_call_count: int = 0
         self._cached_status: Optional[RigStatus] = None
         self._last_status_time: float = 0.0
+        # JSON-safe band presets, rebuilt only when cfg.band_presets is replaced
+        self._presets_src: Optional[List[Any]] = None
+        self._presets_payload: List[Dict[str, Any]] = []
 
     def _make_backend(self, cfg: RigConfig) -> RigBackend:
         if cfg.managed:
@@ -101,25 +104,10 @@ class RigClient:
         """
         allow_oob = bool(getattr(self.cfg, "allow_out_of_band", False))
         if not allow_oob:
-            presets = getattr(self.cfg, "band_presets", [])
-            in_any = False
-            has_any_ranges = False
-            for p in presets:
-                try:
-                    if getattr(p, "enabled", True) is False:
-                        continue
-                    lo = getattr(p, "lower_hz", None)
-                    hi = getattr(p, "upper_hz", None)
-                    if lo is None or hi is None:
-                        # Band preset without explicit ranges - allow any frequency
-                        in_any = True
-                        break
-                    has_any_ranges = True
-                    if hz >= int(lo) and hz <= int(hi):
-                        in_any = True
-                        break
-                except Exception:
-                    continue
+            ranges = self.cfg.band_ranges()
+            # A preset without explicit ranges allows any frequency
+            in_any = ranges.has_open or ranges.contains(hz)
+            has_any_ranges = bool(ranges.lowers)
             # Only reject if we have explicit ranges and frequency doesn't match any
             if has_any_ranges and not in_any:
                 self._last_error = "Frequency out of configured band ranges"
@@ -314,6 +302,28 @@ class RigClient:
         if self._backend:
             await self._backend.close()
 
+    def _band_presets_payload(self) -> List[Dict[str, Any]]:
+        """Return the band presets as plain dicts for status payloads.
+        
+        Presets only change when a new config is applied, which replaces the
+        list object, so the converted list is reused across status ticks.
+        Callers must treat it as read-only.
+        """
+        presets = self.cfg.band_presets
+        if presets is not self._presets_src:
+            self._presets_payload = [
+                {
+                    "label": p.label,
+                    "frequency_hz": p.frequency_hz,
+                    "enabled": p.enabled,
+                    "lower_hz": p.lower_hz,
+                    "upper_hz": p.upper_hz,
+                }
+                for p in presets
+            ]
+            self._presets_src = presets
+        return self._presets_payload
+
     async def safe_status(self) -> Dict[str, Any]:
         """Get JSON-safe rig status including capabilities and band presets.
         
@@ -336,16 +346,7 @@ class RigClient:
             "caps": self._caps,
             "modes": self._modes,
             "caps_detected": self._caps_detected,
-            "band_presets": [
-                {
-                    "label": p.label,
-                    "frequency_hz": p.frequency_hz,
-                    "enabled": p.enabled,
-                    "lower_hz": p.lower_hz,
-                    "upper_hz": p.upper_hz,
-                }
-                for p in self.cfg.band_presets
-            ],
+            "band_presets": self._band_presets_payload(),
             "allow_out_of_band": self.cfg.allow_out_of_band,
             "check_caps_call_count": self._check_caps_call_count,
             "color": getattr(self.cfg, "color", "#a4c356"),
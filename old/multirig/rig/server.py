@@ -9,7 +9,7 @@ from .common import RigctlError
 from .protocols import HamlibParser
 from ..hamlib.parser import parse_line
 from ..hamlib.formatter import format_response
-from ..hamlib.messages import GetInfo, Model, Version, Token, SetConf, GetConf
+from ..hamlib.messages import GetInfo, Model, Version, Token, SetConf, GetConf, SetFreq, SetMode, SetPtt
 from ..hamlib.responses import (
     InfoResponse, ModelResponse, VersionResponse, ConfResponse, SuccessResponse
 )
@@ -66,6 +66,11 @@ class BaseTcpServer:
         self._server: Optional[asyncio.base_events.Server] = None
         self._lock = asyncio.Lock()
 
+    @property
+    def running(self) -> bool:
+        """Whether the server is currently listening."""
+        return self._server is not None
+
     async def start(self) -> None:
         """Start the TCP server.
 
@@ -86,6 +91,26 @@ class BaseTcpServer:
         await self._server.wait_closed()
         self._server = None
 
+    async def reconfigure(self, host: str, port: int, start: bool = True) -> None:
+        """Move the listener to a new address, keeping this server instance.
+
+        Only the listening socket is replaced; handlers and other state are
+        reused. A no-op if the address and running state already match.
+
+        Args:
+            host: The new host address to bind to.
+            port: The new port number to bind to.
+            start: Whether the server should be listening afterwards.
+        """
+        if (self.host, self.port) != (host, port):
+            await self.stop()
+            self.host = host
+            self.port = port
+        if start:
+            await self.start()
+        else:
+            await self.stop()
+
     async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
         """Handle an incoming client connection.
 
@@ -163,6 +188,17 @@ class RigctlServer(BaseTcpServer):
             return None
         return rigs[idx]
 
+    async def reconfigure(self, host: str, port: int, start: bool = True) -> None:
+        """Move the listener to a new address, keeping this server instance.
+
+        Args:
+            host: The new host address to bind to.
+            port: The new port number to bind to.
+            start: Whether the server should be listening afterwards.
+        """
+        self._cfg = RigctlServerConfig(host=host, port=port)
+        await super().reconfigure(host, port, start)
+
     async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
         try:
             while True:
@@ -298,7 +334,6 @@ class RigctlServer(BaseTcpServer):
         # Determine if we should broadcast (set commands with sync enabled)
         broadcast = False
         if self.get_rigctl_to_main_enabled() and self.get_sync_enabled():
-            from ..hamlib.messages import SetFreq, SetMode, SetPtt
             if isinstance(cmd, (SetFreq, SetMode, SetPtt)):
                 broadcast = True
         
@@ -74,6 +74,47 @@ class RigStatus:
         return changed
 
 
+# Fields that tick on every poll without reflecting a user-visible change
+_VOLATILE_RIG_FIELDS = frozenset({"check_caps_call_count"})
+
+
+def _status_key(status: Dict[str, Any]) -> Any:
+    """Comparable view of a full status dict, ignoring volatile rig fields."""
+    rigs = [
+        {k: v for k, v in r.items() if k not in _VOLATILE_RIG_FIELDS}
+        for r in status.get("rigs", [])
+    ]
+    return ({k: v for k, v in status.items() if k != "rigs"}, rigs)
+
+
+async def collect_rig_statuses(rigs: List[RigClient]) -> List[Dict[str, Any]]:
+    """Fetch ``safe_status()`` for every rig concurrently.
+
+    Each rig talks to its own rigctld/serial backend, so the round-trips are
+    overlapped and the total latency is bounded by the slowest rig rather
+    than the sum of all of them.
+
+    Args:
+        rigs: Rig clients to query, in index order.
+
+    Returns:
+        One status dict per rig with its ``index`` attached. A rig whose
+        status call raised is reported as ``{"error": ..., "index": idx}``.
+    """
+    results = await asyncio.gather(
+        *(rig.safe_status() for rig in rigs), return_exceptions=True
+    )
+    statuses: List[Dict[str, Any]] = []
+    for idx, result in enumerate(results):
+        if isinstance(result, BaseException):
+            if isinstance(result, asyncio.CancelledError):
+                raise result
+            result = {"error": str(result)}
+        result["index"] = idx
+        statuses.append(result)
+    return statuses
+
+
 class MessageRouter:
     """Central async message router for all rig communication.
     
@@ -105,15 +146,65 @@ class MessageRouter:
         
         # Background tasks
         self._poll_task: Optional[asyncio.Task] = None
+        self._keepalive_task: Optional[asyncio.Task] = None
         self._running = False
         
+        # Subscribers are re-sent the current status when nothing has been
+        # broadcast for this long, so idle dashboards still see a heartbeat
+        self.keepalive_s: float = 5.0
+        self._last_publish_at: float = 0.0
+        self._last_published_key: Optional[Any] = None
+        
         # Last known state for sync change detection
         self._last_sync_state: tuple = (None, None, None)
+        
+        # Most recent full status, shared by WebSocket clients so that M
+        # connections cost one rig query per poll interval instead of M
+        self._status_snapshot: Optional[Dict[str, Any]] = None
+        self._status_snapshot_at: float = 0.0
+        self._status_lock = asyncio.Lock()
+        
+        # Indices of enabled rigs and of enabled rigs that follow the main
+        # rig; rebuilt lazily after set_rigs() or invalidate_status()
+        self._enabled_idxs: Optional[List[int]] = None
+        self._follower_idxs: List[int] = []
     
     def set_rigs(self, rigs: List[RigClient]) -> None:
         """Set the list of RigClients to manage."""
         self._rigs = rigs
         self._status_cache = {i: RigStatus() for i in range(len(rigs))}
+        self._status_snapshot = None
+        self._enabled_idxs = None
+    
+    def invalidate_status(self) -> None:
+        """Drop the status snapshot and the cached rig flags.
+        
+        Call after changing rig config (``enabled``, ``follow_main``, ...) so
+        the next read queries the rigs and re-reads their flags.
+        """
+        self._status_snapshot = None
+        self._enabled_idxs = None
+    
+    def enabled_indices(self) -> List[int]:
+        """Indices of the enabled rigs."""
+        if self._enabled_idxs is None:
+            self._build_rig_masks()
+        return self._enabled_idxs
+    
+    def follower_indices(self) -> List[int]:
+        """Indices of the enabled rigs that follow the main rig.
+        
+        May include the source rig; callers skip it themselves.
+        """
+        if self._enabled_idxs is None:
+            self._build_rig_masks()
+        return self._follower_idxs
+    
+    def _build_rig_masks(self) -> None:
+        rigs = self._rigs
+        enabled = [i for i, rig in enumerate(rigs) if getattr(rig.cfg, "enabled", True)]
+        self._follower_idxs = [i for i in enabled if getattr(rigs[i].cfg, "follow_main", True)]
+        self._enabled_idxs = enabled
     
     @property
     def rigs(self) -> List[RigClient]:
@@ -125,17 +216,20 @@ class MessageRouter:
             return
         self._running = True
         self._poll_task = asyncio.create_task(self._poll_loop())
+        self._keepalive_task = asyncio.create_task(self._keepalive_loop())
     
     async def stop(self) -> None:
         """Stop the router's background tasks."""
         self._running = False
-        if self._poll_task:
-            self._poll_task.cancel()
-            try:
-                await self._poll_task
-            except asyncio.CancelledError:
-                pass
-            self._poll_task = None
+        for task in (self._poll_task, self._keepalive_task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._poll_task = None
+        self._keepalive_task = None
     
     def subscribe_ws(self) -> asyncio.Queue:
         """Subscribe to status updates. Returns a queue that receives status dicts."""
@@ -150,6 +244,28 @@ class MessageRouter:
     async def _broadcast_status(self) -> None:
         """Push current status to all WebSocket subscribers."""
         status = await self.get_full_status()
+        self._status_snapshot = status
+        self._status_snapshot_at = time.monotonic()
+        self._publish(status)
+    
+    async def _broadcast_if_changed(self) -> bool:
+        """Refresh the snapshot and push it only if it differs from the last push.
+        
+        Returns:
+            True if subscribers were sent a new status.
+        """
+        status = await self.get_full_status()
+        self._status_snapshot = status
+        self._status_snapshot_at = time.monotonic()
+        if _status_key(status) == self._last_published_key:
+            return False
+        self._publish(status)
+        return True
+    
+    def _publish(self, status: Dict[str, Any]) -> None:
+        """Hand one status dict to every subscriber queue."""
+        self._last_publish_at = time.monotonic()
+        self._last_published_key = _status_key(status)
         dead_queues = []
         
         for q in self._ws_subscribers:
@@ -170,11 +286,7 @@ class MessageRouter:
         Uses rig.safe_status() which has its own caching. The router's cache
         is primarily for detecting changes to trigger WebSocket broadcasts.
         """
-        rigs_status = []
-        for idx, rig in enumerate(self._rigs):
-            rig_data = await rig.safe_status()
-            rig_data["index"] = idx
-            rigs_status.append(rig_data)
+        rigs_status = await collect_rig_statuses(self._rigs)
         
         return {
             "rigs": rigs_status,
@@ -186,6 +298,26 @@ class MessageRouter:
             ),
         }
     
+    async def get_cached_status(self) -> Dict[str, Any]:
+        """Get full status, reusing a snapshot younger than the poll interval.
+        
+        Concurrent callers share a single refresh. Callers must not mutate
+        the returned dict since it is handed to every subscriber.
+        """
+        max_age = max(0.1, self.poll_interval_ms / 1000.0)
+        snapshot = self._status_snapshot
+        if snapshot is not None and time.monotonic() - self._status_snapshot_at < max_age:
+            return snapshot
+        async with self._status_lock:
+            # Another caller may have refreshed while we waited for the lock
+            snapshot = self._status_snapshot
+            if snapshot is not None and time.monotonic() - self._status_snapshot_at < max_age:
+                return snapshot
+            snapshot = await self.get_full_status()
+            self._status_snapshot = snapshot
+            self._status_snapshot_at = time.monotonic()
+            return snapshot
+    
     async def submit(
         self,
         cmd: HamlibCommand,
@@ -252,13 +384,8 @@ class MessageRouter:
         tasks = []
         first_resp: Optional[HamlibResponse] = None
         
-        for idx, rig in enumerate(self._rigs):
-            if not getattr(rig.cfg, "enabled", True):
-                continue
-            if not getattr(rig.cfg, "follow_main", True):
-                continue
-            
-            tasks.append(self._execute_on_rig(rig, cmd, idx))
+        for idx in self.follower_indices():
+            tasks.append(self._execute_on_rig(self._rigs[idx], cmd, idx))
         
         if tasks:
             results = await asyncio.gather(*tasks, return_exceptions=True)
@@ -277,19 +404,46 @@ class MessageRouter:
         )
     
     async def _sync_from_command(self, cmd: HamlibCommand) -> None:
-        """Broadcast a set command to follower rigs (autodetect sync)."""
-        for idx, rig in enumerate(self._rigs):
-            if idx == self.source_index:
-                continue
-            if not getattr(rig.cfg, "enabled", True):
-                continue
-            if not getattr(rig.cfg, "follow_main", True):
-                continue
-            
+        """Broadcast a set command to follower rigs (autodetect sync).
+        
+        Followers are sent the command concurrently; individual failures are
+        ignored.
+        """
+        async def _send(rig: RigClient) -> None:
             try:
                 await rig.execute(cmd)
             except Exception:
                 pass
+        
+        await asyncio.gather(
+            *(
+                _send(self._rigs[idx])
+                for idx in self.follower_indices()
+                if idx != self.source_index
+            )
+        )
+    
+    async def _keepalive_loop(self) -> None:
+        """Single heartbeat producer for all WebSocket subscribers.
+        
+        Replaces a per-connection timer: one task re-publishes the shared
+        status snapshot when nothing else was broadcast within
+        ``keepalive_s``, so rig I/O does not scale with the client count.
+        """
+        while self._running:
+            try:
+                idle = time.monotonic() - self._last_publish_at
+                if idle < self.keepalive_s:
+                    await asyncio.sleep(self.keepalive_s - idle)
+                    continue
+                if self._ws_subscribers:
+                    self._publish(await self.get_cached_status())
+                else:
+                    self._last_publish_at = time.monotonic()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                await asyncio.sleep(self.keepalive_s)
     
     async def _poll_loop(self) -> None:
         """Background polling loop for detecting direct rig changes."""
@@ -299,20 +453,25 @@ class MessageRouter:
                 await asyncio.sleep(interval)
                 
                 # Check capabilities for all rigs
-                for rig in self._rigs:
-                    if getattr(rig.cfg, "enabled", True):
-                        try:
-                            await rig.check_and_refresh_caps()
-                        except Exception:
-                            pass
+                await asyncio.gather(
+                    *(
+                        self._rigs[idx].check_and_refresh_caps()
+                        for idx in self.enabled_indices()
+                    ),
+                    return_exceptions=True,
+                )
                 
                 if not self.sync_enabled:
                     # Still update status cache even if sync disabled
                     await self._update_all_status()
-                    continue
+                else:
+                    # Poll source rig for sync
+                    await self._poll_source_for_sync()
                 
-                # Poll source rig for sync
-                await self._poll_source_for_sync()
+                # Push only when something changed; the keepalive loop
+                # covers idle periods
+                if self._ws_subscribers:
+                    await self._broadcast_if_changed()
                 
             except asyncio.CancelledError:
                 raise
@@ -321,11 +480,17 @@ class MessageRouter:
     
     async def _update_all_status(self) -> None:
         """Update status cache for all rigs."""
-        for idx, rig in enumerate(self._rigs):
-            if not getattr(rig.cfg, "enabled", True):
+        idxs = self.enabled_indices()
+        # Query every rig at once so one slow link does not delay the rest
+        results = await asyncio.gather(
+            *(self._rigs[idx].status() for idx in idxs), return_exceptions=True
+        )
+        for idx, status in zip(idxs, results):
+            if isinstance(status, asyncio.CancelledError):
+                raise status
+            if isinstance(status, BaseException):
                 continue
             try:
-                status = await rig.status()
                 cached = self._status_cache.get(idx)
                 if cached:
                     cached.connected = status.connected
@@ -343,10 +508,7 @@ class MessageRouter:
             return
         
         # Validate source index
-        enabled_idxs = [
-            i for i, r in enumerate(self._rigs)
-            if getattr(r.cfg, "enabled", True)
-        ]
+        enabled_idxs = self.enabled_indices()
         if not enabled_idxs:
             return
         
@@ -369,14 +531,9 @@ class MessageRouter:
             return
         
         # State changed - sync to followers
-        for idx, rig in enumerate(self._rigs):
-            if idx == src_idx:
-                continue
-            if not getattr(rig.cfg, "enabled", True):
-                continue
-            if not getattr(rig.cfg, "follow_main", True):
-                continue
-            
+        async def _follow(rig: RigClient) -> None:
+            # Frequency before mode on each rig; the rigs themselves are
+            # independent and are updated concurrently
             try:
                 rig._last_error = None
                 if freq is not None:
@@ -390,5 +547,9 @@ class MessageRouter:
             except Exception:
                 pass
         
+        await asyncio.gather(
+            *(_follow(self._rigs[idx]) for idx in self.follower_indices() if idx != src_idx)
+        )
+        
         self._last_sync_state = current_state
         await self._broadcast_status()
@@ -1,25 +1,40 @@
 from __future__ import annotations
 import asyncio
+import hashlib
+import json
 import os
 import re
 import socket
 import subprocess
 import time
 from pathlib import Path
-from typing import Dict, Any
+from typing import AsyncIterator, Dict, Any, List, Optional, Tuple, Union
 
-import yaml
 from fastapi import APIRouter, Request, Response, WebSocket, WebSocketDisconnect
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import HTMLResponse, JSONResponse, StreamingResponse
 try:
     import orjson
     from fastapi.responses import ORJSONResponse
 except ImportError:
+    orjson = None
     ORJSONResponse = JSONResponse
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+try:
+    import psutil
+except ImportError:
+    psutil = None
 from fastapi.templating import Jinja2Templates
+from pydantic import ValidationError
 
-from .config import AppConfig, save_config, _migrate_config
-from .core import apply_config, ensure_default_profile
+from .config import AppConfig, RigConfig, _migrate_config, detect_bands_from_ranges, dump_yaml_bytes, load_yaml, parse_dump_state_ranges
+from .core import apply_config, config_dump, ensure_default_profile, invalidate_config_cache, schedule_config_save, schedule_rig_close
+from .hamlib.messages import SetFreq, SetMode
+from .rig import RigClient
+from .router import collect_rig_statuses
 
 router = APIRouter(default_response_class=ORJSONResponse)
 
@@ -29,55 +44,154 @@ TEMPLATES_DIR = BASE_DIR / "templates"
 templates = Jinja2Templates(directory=str(TEMPLATES_DIR))
 
 # React SPA entry point
+# (mtime_ns, size, html) of the last static/index.html read
+_react_index_cache: Optional[Tuple[int, int, str]] = None
+
 def _serve_react_app():
-    """Serve the React SPA index.html."""
+    """Serve the React SPA index.html, re-reading it only when it changes."""
+    global _react_index_cache
     index_path = STATIC_DIR / "index.html"
-    if index_path.exists():
-        return HTMLResponse(content=index_path.read_text(), status_code=200)
-    # Fallback to template if React build doesn't exist
-    return None
+    try:
+        st = os.stat(index_path)
+    except OSError:
+        # Fallback to template if React build doesn't exist
+        return None
+    cached = _react_index_cache
+    if cached is None or cached[:2] != (st.st_mtime_ns, st.st_size):
+        cached = (st.st_mtime_ns, st.st_size, index_path.read_text())
+        _react_index_cache = cached
+    return HTMLResponse(content=cached[2], status_code=200)
+
+# Static files the Jinja templates cache-bust with ?ts=
+_TEMPLATE_ASSETS = ("style.css", "settings.js", "app.js")
+_assets_ts_value: Optional[int] = None
+# (app version, html) of the rendered fallback index page
+_index_html_cache: Optional[Tuple[str, str]] = None
+
+def _assets_ts() -> int:
+    """Cache-busting stamp for template assets: their newest mtime in ms.
+
+    Computed once per process; static files only change with a deploy.
+    """
+    global _assets_ts_value
+    if _assets_ts_value is None:
+        mtimes = []
+        for name in _TEMPLATE_ASSETS:
+            try: mtimes.append(os.stat(STATIC_DIR / name).st_mtime_ns)
+            except OSError: pass
+        _assets_ts_value = max(mtimes) // 1_000_000 if mtimes else int(time.time() * 1000)
+    return _assets_ts_value
 
 # Pages - React SPA routes
 @router.get("/", response_class=HTMLResponse)
 async def index(request: Request):
+    global _index_html_cache
     react_response = _serve_react_app()
     if react_response:
         return react_response
-    # Fallback to Jinja template
-    return templates.TemplateResponse("index.html", {
-        "request": request, "assets_ts": int(time.time() * 1000), "app_version": getattr(request.app, "version", ""),
+    # Fallback to Jinja template; its context never changes, so render once
+    version = getattr(request.app, "version", "")
+    cached = _index_html_cache
+    if cached is not None and cached[0] == version:
+        return HTMLResponse(content=cached[1], status_code=200)
+    response = templates.TemplateResponse(request, "index.html", {
+        "assets_ts": _assets_ts(), "app_version": version,
     })
+    _index_html_cache = (version, bytes(response.body).decode("utf-8"))
+    return response
 
 @router.get("/settings", response_class=HTMLResponse)
 async def settings_page(request: Request):
     react_response = _serve_react_app()
     if react_response:
         return react_response
-    # Fallback to Jinja template
-    return templates.TemplateResponse("settings.html", {
-        "request": request, "config": request.app.state.config, "assets_ts": int(time.time() * 1000), "app_version": getattr(request.app, "version", ""),
+    # Fallback to Jinja template, rendered once per distinct config
+    key = hashlib.blake2b(request.app.state.config.model_dump_json().encode("utf-8"), digest_size=16).hexdigest()
+    cached = getattr(request.app.state, "settings_html_cache", None)
+    if cached is not None and cached[0] == key:
+        return HTMLResponse(content=cached[1], status_code=200)
+    response = templates.TemplateResponse(request, "settings.html", {
+        "config": request.app.state.config, "assets_ts": _assets_ts(), "app_version": getattr(request.app, "version", ""),
     })
+    request.app.state.settings_html_cache = (key, bytes(response.body).decode("utf-8"))
+    return response
 
 # API
+def _etag(body: bytes) -> str:
+    """Return a strong ETag for a response body."""
+    return '"%s"' % hashlib.blake2b(body, digest_size=8).hexdigest()
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Whether the request's If-None-Match lists ``etag``."""
+    return etag in [t.strip() for t in request.headers.get("if-none-match", "").split(",")]
+
+def _json_bytes(data: Any) -> bytes:
+    """Encode JSON-native data to bytes, with orjson when available."""
+    return orjson.dumps(data) if orjson is not None else json.dumps(data).encode("utf-8")
+
+def _encode_config(cfg: AppConfig) -> tuple[bytes, str]:
+    """Serialize a config to JSON bytes plus a strong ETag for them."""
+    body = _json_bytes(cfg.model_dump(mode="json"))
+    return body, _etag(body)
+
 @router.get("/api/config")
 async def get_config(request: Request):
-    return request.app.state.config
-
-@router.post("/api/config")
-async def update_config(request: Request, cfg: AppConfig):
+    # The config only changes through the write endpoints, which invalidate
+    # this cache, so repeat reads skip model_dump and JSON encoding entirely
+    cached = getattr(request.app.state, "config_json", None)
+    if cached is None:
+        cached = _encode_config(request.app.state.config)
+        request.app.state.config_json = cached
+    body, etag = cached
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
+def _config_request_body() -> Dict[str, Any]:
+    """OpenAPI requestBody for the raw-body ``POST /api/config`` route.
+
+    The schema is embedded in the operation, so its ``$defs`` references
+    point back into it rather than at ``components``.
+    """
+    pointer = "#/paths/~1api~1config/post/requestBody/content/application~1json/schema/$defs/{model}"
+    schema = AppConfig.model_json_schema(ref_template=pointer)
+    return {"requestBody": {"required": True, "content": {"application/json": {"schema": schema}}}}
+
+@router.post("/api/config", openapi_extra=_config_request_body())
+async def update_config(request: Request):
+    # Validate straight from the raw body with pydantic's JSON parser rather
+    # than letting FastAPI decode to a dict first and validate that
+    try:
+        cfg = AppConfig.model_validate_json(await request.body())
+    except ValidationError as e:
+        # Same error locations FastAPI reports for a declared body model
+        raise RequestValidationError([
+            {**err, "loc": ("body", *err["loc"])} for err in e.errors(include_url=False)
+        ])
     await apply_config(request.app, cfg)
     return {"status": "ok"}
 
 @router.get("/api/config/export")
 async def export_config(request: Request):
-    content = yaml.safe_dump(request.app.state.config.model_dump(), sort_keys=False)
-    return Response(content=content, media_type="text/yaml")
+    # Cached until the config changes (see invalidate_config_cache)
+    cached = getattr(request.app.state, "config_yaml", None)
+    if cached is None:
+        data = config_dump(request.app)
+        content = await asyncio.to_thread(dump_yaml_bytes, data)
+        cached = (content, _etag(content))
+        # Don't cache a dump the config moved past while we were in the thread
+        if getattr(request.app.state, "config_dump", None) is data:
+            request.app.state.config_yaml = cached
+    content, etag = cached
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=content, media_type="text/yaml", headers={"ETag": etag})
 
 @router.post("/api/config/import")
 async def import_config(request: Request):
     try:
         body = await request.body()
-        data = yaml.safe_load(body)
+        data = await asyncio.to_thread(load_yaml, body)
         if not isinstance(data, dict):
             return ORJSONResponse({"status": "error", "error": "Invalid YAML: expected dictionary"}, status_code=400)
         cfg = AppConfig.model_validate(_migrate_config(data))
@@ -86,23 +200,24 @@ async def import_config(request: Request):
     except Exception as e:
         return ORJSONResponse({"status": "error", "error": str(e)}, status_code=400)
 
+# Profile bookkeeping stats, scans and may write files; keep it off the loop
 @router.get("/api/config/profiles")
 async def list_config_profiles(request: Request):
-    ensure_default_profile(request.app)
-    return {"status": "ok", "profiles": request.app.state.profiles.list_names()}
+    await ensure_default_profile(request.app)
+    return {"status": "ok", "profiles": await asyncio.to_thread(request.app.state.profiles.list_names)}
 
 @router.get("/api/config/active_profile")
 async def get_active_profile(request: Request):
-    ensure_default_profile(request.app)
-    return {"status": "ok", "name": getattr(request.app.state, "active_profile_name", "")}
+    await ensure_default_profile(request.app)
+    return {"status": "ok", "name": request.app.state.active_profile_name}
 
 @router.post("/api/config/profiles/{name}/create")
 async def create_config_profile(request: Request, name: str):
     if not request.app.state.profiles.is_valid_name(name):
         return ORJSONResponse({"status": "error", "error": "invalid profile name"}, status_code=400)
-    if request.app.state.profiles.exists(name):
+    if await asyncio.to_thread(request.app.state.profiles.exists, name):
         return ORJSONResponse({"status": "error", "error": "profile already exists"}, status_code=409)
-    request.app.state.profiles.save_data(name, request.app.state.config.model_dump())
+    await asyncio.to_thread(request.app.state.profiles.save_data, name, config_dump(request.app))
     return {"status": "ok"}
 
 @router.post("/api/config/profiles/{name}/rename")
@@ -112,12 +227,12 @@ async def rename_config_profile(request: Request, name: str, payload: dict):
         return ORJSONResponse({"status": "error", "error": "invalid profile name"}, status_code=400)
     if name == new_name: return {"status": "ok"}
     try:
-        request.app.state.profiles.rename(name, new_name)
+        await asyncio.to_thread(request.app.state.profiles.rename, name, new_name)
     except FileNotFoundError: return ORJSONResponse({"status": "error", "error": "profile not found"}, status_code=404)
     except FileExistsError: return ORJSONResponse({"status": "error", "error": "profile already exists"}, status_code=409)
-    if getattr(request.app.state, "active_profile_name", "") == name:
+    if request.app.state.active_profile_name == name:
         request.app.state.active_profile_name = new_name
-        request.app.state.profiles.persist_active_name(request.app.state.active_profile_name)
+        await asyncio.to_thread(request.app.state.profiles.persist_active_name, request.app.state.active_profile_name)
     return {"status": "ok"}
 
 @router.post("/api/config/profiles/{name}/duplicate")
@@ -125,11 +240,11 @@ async def duplicate_config_profile(request: Request, name: str, payload: dict):
     new_name = str((payload or {}).get("new_name") or "").strip()
     if not request.app.state.profiles.is_valid_name(name) or not request.app.state.profiles.is_valid_name(new_name):
         return ORJSONResponse({"status": "error", "error": "invalid profile name"}, status_code=400)
-    if request.app.state.profiles.exists(new_name):
+    if await asyncio.to_thread(request.app.state.profiles.exists, new_name):
         return ORJSONResponse({"status": "error", "error": "profile already exists"}, status_code=409)
     try:
-        data = request.app.state.profiles.load_data(name)
-        request.app.state.profiles.save_data(new_name, data)
+        data = await asyncio.to_thread(request.app.state.profiles.load_data, name)
+        await asyncio.to_thread(request.app.state.profiles.save_data, new_name, data)
         return {"status": "ok"}
     except FileNotFoundError: return ORJSONResponse({"status": "error", "error": "profile not found"}, status_code=404)
 
@@ -137,7 +252,7 @@ async def duplicate_config_profile(request: Request, name: str, payload: dict):
 async def save_config_profile(request: Request, name: str):
     if not request.app.state.profiles.is_valid_name(name):
         return ORJSONResponse({"status": "error", "error": "invalid profile name"}, status_code=400)
-    request.app.state.profiles.save_data(name, request.app.state.config.model_dump())
+    await asyncio.to_thread(request.app.state.profiles.save_data, name, config_dump(request.app))
     return {"status": "ok"}
 
 @router.get("/api/config/profiles/{name}/export")
@@ -145,8 +260,8 @@ async def export_config_profile(request: Request, name: str):
     if not request.app.state.profiles.is_valid_name(name):
         return ORJSONResponse({"status": "error", "error": "invalid profile name"}, status_code=400)
     try:
-        data = request.app.state.profiles.load_data(name)
-        return Response(content=yaml.safe_dump(data, sort_keys=False), media_type="text/yaml")
+        content = await asyncio.to_thread(request.app.state.profiles.export_yaml, name)
+        return Response(content=content, media_type="text/yaml")
     except FileNotFoundError: return ORJSONResponse({"status": "error", "error": "profile not found"}, status_code=404)
     except Exception as e: return ORJSONResponse({"status": "error", "error": str(e)}, status_code=400)
 
@@ -155,11 +270,11 @@ async def load_config_profile(request: Request, name: str):
     if not request.app.state.profiles.is_valid_name(name):
         return ORJSONResponse({"status": "error", "error": "invalid profile name"}, status_code=400)
     try:
-        data = request.app.state.profiles.load_data(name)
+        data = await asyncio.to_thread(request.app.state.profiles.load_data, name)
         cfg = AppConfig(**data)
         await apply_config(request.app, cfg)
         request.app.state.active_profile_name = name
-        request.app.state.profiles.persist_active_name(name)
+        await asyncio.to_thread(request.app.state.profiles.persist_active_name, name)
         return {"status": "ok"}
     except Exception as e:
         return ORJSONResponse({"status": "error", "error": str(e)}, status_code=400)
@@ -168,18 +283,18 @@ async def load_config_profile(request: Request, name: str):
 async def delete_config_profile(request: Request, name: str):
     if not request.app.state.profiles.is_valid_name(name):
         return ORJSONResponse({"status": "error", "error": "invalid profile name"}, status_code=400)
-    was_active = getattr(request.app.state, "active_profile_name", "") == name
-    if not request.app.state.profiles.delete(name):
+    was_active = request.app.state.active_profile_name == name
+    if not await asyncio.to_thread(request.app.state.profiles.delete, name):
         return ORJSONResponse({"status": "error", "error": "profile not found"}, status_code=404)
     if was_active:
         request.app.state.active_profile_name = ""
-        request.app.state.profiles.persist_active_name("")
-    ensure_default_profile(request.app)
+        await asyncio.to_thread(request.app.state.profiles.persist_active_name, "")
+    await ensure_default_profile(request.app)
     if was_active:
         try:
-            next_name = str(getattr(request.app.state, "active_profile_name", "") or "").strip()
+            next_name = request.app.state.active_profile_name
             if next_name:
-                data = request.app.state.profiles.load_data(next_name)
+                data = await asyncio.to_thread(request.app.state.profiles.load_data, next_name)
                 cfg = AppConfig.model_validate(_migrate_config(data))
                 await apply_config(request.app, cfg)
         except Exception: pass
@@ -207,9 +322,10 @@ async def set_rig_enabled(request: Request, idx: int, payload: dict):
     try: 
         request.app.state.rigs[idx].cfg.enabled = enabled
         if not enabled:
-            asyncio.create_task(request.app.state.rigs[idx].close())
+            schedule_rig_close(request.app, [request.app.state.rigs[idx]])
     except Exception: pass
-    save_config(request.app.state.config, request.app.state.config_path)
+    invalidate_config_cache(request.app)
+    schedule_config_save(request.app)
     return {"status": "ok", "enabled": enabled}
 
 @router.post("/api/rig/{idx}/follow_main")
@@ -220,7 +336,8 @@ async def set_rig_follow_main(request: Request, idx: int, payload: dict):
     request.app.state.config.rigs[idx].follow_main = follow_main
     try: request.app.state.rigs[idx].cfg.follow_main = follow_main
     except Exception: pass
-    save_config(request.app.state.config, request.app.state.config_path)
+    invalidate_config_cache(request.app)
+    schedule_config_save(request.app)
     return {"status": "ok", "follow_main": follow_main}
 
 @router.post("/api/rig/{idx}/caps")
@@ -237,11 +354,22 @@ async def refresh_rig_caps(request: Request, idx: int):
 @router.post("/api/rig/enabled_all")
 async def set_all_rigs_enabled(request: Request, payload: dict):
     enabled = bool(payload.get("enabled", True))
-    for r in request.app.state.config.rigs: r.enabled = enabled
+    # Rig clients share their RigConfig with app.state.config, so most of the
+    # client-side writes below are no-ops; skip unchanged rigs entirely.
+    changed = False
+    for r in request.app.state.config.rigs:
+        if r.enabled is not enabled:
+            r.enabled = enabled
+            changed = True
     for rig in getattr(request.app.state, "rigs", []):
-        try: rig.cfg.enabled = enabled
+        try:
+            if rig.cfg.enabled is not enabled:
+                rig.cfg.enabled = enabled
+                changed = True
         except Exception: pass
-    save_config(request.app.state.config, request.app.state.config_path)
+    if changed:
+        invalidate_config_cache(request.app)
+        schedule_config_save(request.app)
     return {"status": "ok", "enabled": enabled}
 
 @router.post("/api/rig/{idx}/sync_from_source")
@@ -265,51 +393,136 @@ async def sync_all_once(request: Request):
     st = await src.status()
     if not st.connected or st.frequency_hz is None:
         return {"status": "error", "error": "source rig not connected"}
-    results = []
-    for i, rig in enumerate(request.app.state.rigs):
-        if i == src_idx or not getattr(rig.cfg, "enabled", True) or not getattr(rig.cfg, "follow_main", True):
-            continue
-        freq_ok = await rig.set_frequency(st.frequency_hz)
-        mode_ok = await rig.set_mode(st.mode, st.passband) if st.mode else True
-        results.append({"index": i, "freq_ok": freq_ok, "mode_ok": mode_ok})
-    return {"status": "ok", "results": results}
 
-@router.get("/api/bind_addrs")
-async def get_bind_addrs(request: Request):
+    async def _follow(i: int, rig) -> Dict[str, Any]:
+        # A failing rig is reported on its own entry rather than failing
+        # the whole request, since the others have already been updated
+        try:
+            # Frequency before mode: a band change may reset the rig's mode
+            freq_ok = await rig.set_frequency(st.frequency_hz)
+            mode_ok = await rig.set_mode(st.mode, st.passband) if st.mode else True
+        except Exception as e:
+            return {"index": i, "error": str(e)}
+        return {"index": i, "freq_ok": freq_ok, "mode_ok": mode_ok}
+
+    # Followers are independent rigs, so update them all at once
+    rigs = request.app.state.rigs
+    msg_router = getattr(request.app.state, "router", None)
+    if msg_router is not None:
+        followers = msg_router.follower_indices()
+    else:
+        followers = [
+            i for i, rig in enumerate(rigs)
+            if getattr(rig.cfg, "enabled", True) and getattr(rig.cfg, "follow_main", True)
+        ]
+    results = await asyncio.gather(*(_follow(i, rigs[i]) for i in followers if i != src_idx))
+    return {"status": "ok", "results": list(results)}
+
+# IPv4 addresses in `ifconfig` output
+_INET_RE = re.compile(rb"\binet\s+(\d+\.\d+\.\d+\.\d+)")
+
+# Interfaces change on a scale of minutes; reuse the last enumeration for this long
+BIND_ADDRS_TTL_S = 30.0
+_bind_addrs_cache: Optional[Tuple[float, List[str]]] = None
+
+def _enumerate_bind_addrs() -> List[str]:
+    """List local IPv4 addresses the rigctl listener could bind to.
+
+    The interface table already holds every local address, so the hostname
+    lookup (a resolver round trip) is only used with the ifconfig fallback.
+    """
     addrs = {"127.0.0.1", "0.0.0.0"}
+    if psutil is not None:
+        # Reads the interface table directly, no ifconfig fork/exec
+        try:
+            for nic_addrs in psutil.net_if_addrs().values():
+                for a in nic_addrs:
+                    if a.family == socket.AF_INET and a.address: addrs.add(a.address)
+            return sorted(addrs)
+        except Exception: pass
     try:
         for ip in socket.gethostbyname_ex(socket.gethostname())[2]:
             if ip: addrs.add(ip)
     except Exception: pass
     try:
-        out = subprocess.check_output(["ifconfig"], text=True, stderr=subprocess.DEVNULL)
-        for m in re.finditer(r"\binet\s+(\d+\.\d+\.\d+\.\d+)", out):
-            if m.group(1): addrs.add(m.group(1))
+        # Match on the raw bytes; only the captured addresses get decoded
+        out = subprocess.check_output(["ifconfig"], stderr=subprocess.DEVNULL)
+        for m in _INET_RE.finditer(out):
+            if m.group(1): addrs.add(m.group(1).decode("ascii"))
     except Exception: pass
     return sorted(addrs)
 
+@router.get("/api/bind_addrs")
+async def get_bind_addrs(request: Request):
+    global _bind_addrs_cache
+    now = time.monotonic()
+    if _bind_addrs_cache is not None and now - _bind_addrs_cache[0] < BIND_ADDRS_TTL_S:
+        return _bind_addrs_cache[1]
+    # Enumeration in flight, shared by requests that miss the cache together.
+    # Kept on app.state since the future belongs to this app's event loop
+    state = request.app.state
+    pending = getattr(state, "bind_addrs_pending", None)
+    if pending is None or pending.done():
+        # DNS lookups and the ifconfig fallback block; keep them off the event loop
+        pending = state.bind_addrs_pending = asyncio.ensure_future(asyncio.to_thread(_enumerate_bind_addrs))
+    # Shield so one disconnecting client doesn't cancel the others' lookup
+    addrs = await asyncio.shield(pending)
+    _bind_addrs_cache = (now, addrs)
+    return addrs
+
+@router.post("/api/bind_addrs/refresh")
+async def refresh_bind_addrs(request: Request):
+    # For pages that need a fresh sweep, e.g. after plugging in an interface
+    global _bind_addrs_cache
+    _bind_addrs_cache = None
+    return await get_bind_addrs(request)
+
+# (router snapshot, live flags, encoded body) of the last /api/status reply;
+# UI clients polling within one snapshot's lifetime get the same bytes
+_status_body_cache: Optional[Tuple[Dict[str, Any], Tuple[Any, ...], bytes]] = None
+
 @router.get("/api/status")
 async def get_status(request: Request):
     # Use router's cached status if available
+    global _status_body_cache
     msg_router = getattr(request.app.state, "router", None)
     if msg_router is not None:
-        result = await msg_router.get_full_status()
-        result["active_profile"] = getattr(request.app.state, "active_profile_name", "")
-        return result
+        # The snapshot is shared with WebSocket subscribers, so copy it; the
+        # sync flags are plain attributes and always read live
+        snapshot = await msg_router.get_cached_status()
+        live = (
+            msg_router.sync_enabled, msg_router.source_index,
+            msg_router.rigctl_to_main_enabled, request.app.state.active_profile_name,
+        )
+        cached = _status_body_cache
+        if cached is None or cached[0] is not snapshot or cached[1] != live:
+            # Encode straight to bytes; returning the dict would make FastAPI
+            # walk it with jsonable_encoder before the response class encodes it
+            body = _json_bytes({
+                **snapshot,
+                "sync_enabled": live[0],
+                "sync_source_index": live[1],
+                "rigctl_to_main_enabled": live[2],
+                "active_profile": live[3],
+            })
+            cached = _status_body_cache = (snapshot, live, body)
+        return Response(content=cached[2], media_type="application/json")
     
-    # Legacy fallback
-    rigs = [await r.safe_status() for r in request.app.state.rigs]
-    for idx, r in enumerate(rigs): r["index"] = idx
+    return await _legacy_status(request.app)
+
+async def _legacy_status(app) -> Dict[str, Any]:
+    """Status polled straight from the rigs, for apps running without a router."""
+    rigs = await collect_rig_statuses(app.state.rigs)
     result = {
         "rigs": rigs,
-        "active_profile": getattr(request.app.state, "active_profile_name", ""),
-        "sync_enabled": request.app.state.sync_service.enabled,
-        "sync_source_index": request.app.state.sync_service.source_index,
-        "rigctl_to_main_enabled": getattr(request.app.state.config, "rigctl_to_main_enabled", True),
+        "active_profile": app.state.active_profile_name,
+        "sync_enabled": app.state.sync_service.enabled,
+        "sync_source_index": app.state.sync_service.source_index,
+        "rigctl_to_main_enabled": getattr(app.state.config, "rigctl_to_main_enabled", True),
         "all_rigs_enabled": bool(rigs) and all(r.get("enabled", True) is not False for r in rigs),
     }
-    if hasattr(request.app.state.sync_service, '_task'):
-        result["sync_service_running"] = request.app.state.sync_service._task is not None and not request.app.state.sync_service._task.done()
+    if hasattr(app.state.sync_service, '_task'):
+        result["sync_service_running"] = app.state.sync_service._task is not None and not app.state.sync_service._task.done()
     return result
 
 @router.post("/api/sync")
@@ -332,7 +545,8 @@ async def set_sync(request: Request, payload: dict):
                 msg_router.source_index = idx
         except Exception: pass
     
-    save_config(request.app.state.config, request.app.state.config_path)
+    invalidate_config_cache(request.app)
+    schedule_config_save(request.app)
     return {"status": "ok", "enabled": request.app.state.sync_service.enabled, "sync_source_index": request.app.state.sync_service.source_index}
 
 @router.post("/api/rigctl_to_main")
@@ -345,12 +559,16 @@ async def set_rigctl_to_main(request: Request, payload: dict):
     if msg_router:
         msg_router.rigctl_to_main_enabled = enabled
     
-    save_config(request.app.state.config, request.app.state.config_path)
+    invalidate_config_cache(request.app)
+    schedule_config_save(request.app)
     return {"status": "ok", "enabled": enabled}
 
+# Legacy two-rig aliases accepted in place of a numeric index
+_WHICH_MAP = {"a": 0, "b": 1}
+
 @router.post("/api/rig/{which}/set")
 async def set_rig(request: Request, which: str, payload: dict):
-    idx = {"a": 0, "b": 1}.get(which.lower())
+    idx = _WHICH_MAP.get(which.lower())
     if idx is None:
         try: idx = int(which)
         except ValueError: return {"status": "error", "error": "invalid rig index"}
@@ -365,42 +583,46 @@ async def set_rig(request: Request, which: str, payload: dict):
     if freq is not None:
         hz = int(freq)
         if not getattr(rig.cfg, "allow_out_of_band", False):
-            presets = [p for p in getattr(rig.cfg, "band_presets", []) if getattr(p, "enabled", True) is not False]
-            ranges = [(getattr(p, "lower_hz", None), getattr(p, "upper_hz", None)) for p in presets]
-            if any(r[0] is not None and r[1] is not None for r in ranges):
-                if not any(r[0] is not None and r[1] is not None and hz >= int(r[0]) and hz <= int(r[1]) for r in ranges):
-                    return {"status": "error", "error": "frequency out of configured band ranges", "frequency_hz": hz}
-        res["freq_ok"] = await rig.set_frequency(hz)
-        
-        # Trigger sync if this is the source rig and sync is enabled
-        if msg_router and msg_router.sync_enabled and idx == msg_router.source_index:
-            from .hamlib.messages import SetFreq
-            cmd = SetFreq(frequency=hz, source="http")
-            await msg_router._sync_from_command(cmd)
+            ranges = rig.cfg.band_ranges()
+            if ranges.lowers and not ranges.contains(hz):
+                return {"status": "error", "error": "frequency out of configured band ranges", "frequency_hz": hz}
+    
+    # Trigger sync if this is the source rig and sync is enabled
+    sync = bool(msg_router and msg_router.sync_enabled and idx == msg_router.source_index)
+    
+    if freq is not None:
+        if sync:
+            # Followers are other rigs; update them alongside the source
+            res["freq_ok"], _ = await asyncio.gather(
+                rig.set_frequency(hz),
+                msg_router._sync_from_command(SetFreq(frequency=hz, source="http")),
+            )
             should_broadcast = True
+        else:
+            res["freq_ok"] = await rig.set_frequency(hz)
     
     if mode is not None:
-        res["mode_ok"] = await rig.set_mode(str(mode), pb)
-        
-        # Trigger sync for mode change
-        if msg_router and msg_router.sync_enabled and idx == msg_router.source_index:
-            from .hamlib.messages import SetMode
-            cmd = SetMode(mode=str(mode), passband=pb, source="http")
-            await msg_router._sync_from_command(cmd)
+        if sync:
+            res["mode_ok"], _ = await asyncio.gather(
+                rig.set_mode(str(mode), pb),
+                msg_router._sync_from_command(SetMode(mode=str(mode), passband=pb, source="http")),
+            )
             should_broadcast = True
+        else:
+            res["mode_ok"] = await rig.set_mode(str(mode), pb)
     
     if vfo is not None: res["vfo_ok"] = await rig.set_vfo(str(vfo))
     
     # Broadcast status update to WebSocket clients
     if should_broadcast and msg_router:
         await msg_router._broadcast_status()
+    elif msg_router:
+        msg_router.invalidate_status()
     
     return {"status": "ok", **res}
 
 @router.post("/api/test-rig")
 async def test_rig_connection(request: Request, rig_config: dict):
-    from .config import RigConfig, parse_dump_state_ranges, detect_bands_from_ranges
-    from .rig import RigClient
     try:
         cfg = RigConfig.model_validate(rig_config)
         test_rig = RigClient(cfg)
@@ -425,65 +647,124 @@ async def test_rig_connection(request: Request, rig_config: dict):
             return {"status": "error", "message": f"Connection test failed: {str(e)}", "details": {"error": str(e)}}
     except Exception as e: return {"status": "error", "message": f"Invalid configuration: {str(e)}", "details": {"error": str(e)}}
 
+# The settings UI re-requests the port list while open; enumeration walks
+# /sys (or IOKit/SetupAPI), so reuse a recent scan for this long
+SERIAL_PORTS_TTL_S = 2.0
+_serial_ports_cache: Optional[Tuple[float, List[Dict[str, Any]]]] = None
+
+def _enumerate_serial_ports() -> List[Dict[str, Any]]:
+    """List serial devices via pyserial (blocking)."""
+    import serial.tools.list_ports
+    return [{"device": p.device, "description": p.description, "hwid": p.hwid} for p in serial.tools.list_ports.comports()]
+
 @router.get("/api/serial-ports")
 async def list_serial_ports(request: Request):
+    global _serial_ports_cache
+    now = time.monotonic()
+    if _serial_ports_cache is not None and now - _serial_ports_cache[0] < SERIAL_PORTS_TTL_S:
+        return {"status": "ok", "ports": _serial_ports_cache[1]}
     try:
-        import serial.tools.list_ports
-        return {"status": "ok", "ports": [{"device": p.device, "description": p.description, "hwid": p.hwid} for p in serial.tools.list_ports.comports()]}
+        ports = await asyncio.to_thread(_enumerate_serial_ports)
     except ImportError: return {"status": "error", "message": "pyserial not installed.", "ports": []}
     except Exception as e: return {"status": "error", "message": str(e), "ports": []}
+    _serial_ports_cache = (now, ports)
+    return {"status": "ok", "ports": ports}
+
+def _wants_msgpack(ws: WebSocket) -> bool:
+    """Whether the client asked for MessagePack frames via ``?format=msgpack``.
+
+    Binary frames are opt-in because the bundled frontends ``JSON.parse``
+    text frames; clients that decode MessagePack get smaller frames.
+    """
+    return msgpack is not None and ws.query_params.get("format") == "msgpack"
+
+# Last encoded frame per format, keyed by the identity of the shared status
+# dict the router handed out. Holding a reference keeps the id() stable.
+_status_frames: Dict[bool, Tuple[Any, str, Union[str, bytes]]] = {}
+
+def _encode_status_frame(status: Dict[str, Any], active_profile: str, binary: bool = False) -> Union[str, bytes]:
+    """Encode a status frame once for every subscriber of the same broadcast.
+
+    The router fans the same dict out to all WebSocket queues, so the first
+    handler to see it serializes it and the rest reuse the frame. Frames are
+    text (orjson when available) because the frontends ``JSON.parse`` the
+    message data directly, unless ``binary`` selects MessagePack.
+    """
+    cached = _status_frames.get(binary)
+    if cached is not None and cached[0] is status and cached[1] == active_profile:
+        return cached[2]
+    payload = {**status, "active_profile": active_profile}
+    if binary:
+        frame: Union[str, bytes] = msgpack.packb(payload, use_bin_type=True)
+    elif orjson is not None:
+        frame = orjson.dumps(payload).decode("utf-8")
+    else:
+        frame = json.dumps(payload)
+    _status_frames[binary] = (status, active_profile, frame)
+    return frame
+
+async def _status_stream(app) -> AsyncIterator[Dict[str, Any]]:
+    """Yield the current status, then each status the router broadcasts.
+
+    The router is the single status producer: it pushes on change and sends
+    the heartbeat, so WebSocket and SSE clients only forward what they get.
+    Without a router, fall back to polling the rigs every poll interval.
+    """
+    msg_router = getattr(app.state, "router", None)
+    if msg_router is None:
+        while True:
+            yield await _legacy_status(app)
+            await asyncio.sleep(max(0.1, app.state.config.poll_interval_ms / 1000.0))
+    queue = msg_router.subscribe_ws()
+    try:
+        yield await msg_router.get_cached_status()
+        while True:
+            status = await queue.get()
+            # Each status is a full snapshot: if a burst queued up while the
+            # client was being sent the last one, skip straight to the newest
+            while not queue.empty():
+                status = queue.get_nowait()
+            yield status
+    finally:
+        msg_router.unsubscribe_ws(queue)
 
 @router.websocket("/ws")
 async def ws_endpoint(ws: WebSocket):
     await ws.accept()
-    
-    # Check if router is available
-    msg_router = getattr(ws.app.state, "router", None)
-    
-    if msg_router is not None:
-        # New path: subscribe to router for push-based updates
-        queue = msg_router.subscribe_ws()
+    binary = _wants_msgpack(ws)
+    stream = _status_stream(ws.app)
+    try:
+        async for status in stream:
+            frame = _encode_status_frame(
+                status, ws.app.state.active_profile_name, binary
+            )
+            if binary:
+                await ws.send_bytes(frame)
+            else:
+                await ws.send_text(frame)
+    except (WebSocketDisconnect, Exception):
+        pass
+    finally:
+        await stream.aclose()
+
+@router.get("/sse/status")
+async def sse_status(request: Request):
+    """Server-Sent Events feed of the same status frames as ``/ws``.
+
+    Suited to read-only dashboards: plain HTTP, and browsers' EventSource
+    reconnects on its own.
+    """
+    async def events() -> AsyncIterator[str]:
+        stream = _status_stream(request.app)
         try:
-            # Send initial status
-            await ws.send_json(await msg_router.get_full_status())
-            
-            while True:
-                try:
-                    # Wait for status update from router (with timeout for keepalive)
-                    status = await asyncio.wait_for(queue.get(), timeout=5.0)
-                    # Enrich with active profile name
-                    status["active_profile"] = getattr(ws.app.state, "active_profile_name", "")
-                    await ws.send_json(status)
-                except asyncio.TimeoutError:
-                    # No update, send current status as keepalive
-                    status = await msg_router.get_full_status()
-                    status["active_profile"] = getattr(ws.app.state, "active_profile_name", "")
-                    await ws.send_json(status)
-        except (WebSocketDisconnect, Exception):
-            pass
+            async for status in stream:
+                frame = _encode_status_frame(status, request.app.state.active_profile_name)
+                yield f"event: status\ndata: {frame}\n\n"
         finally:
-            msg_router.unsubscribe_ws(queue)
-    else:
-        # Legacy path: poll-based updates
-        try:
-            async def get_app_status():
-                rigs = [await r.safe_status() for r in ws.app.state.rigs]
-                for idx, r in enumerate(rigs): r["index"] = idx
-                result = {
-                    "rigs": rigs,
-                    "active_profile": getattr(ws.app.state, "active_profile_name", ""),
-                    "sync_enabled": ws.app.state.sync_service.enabled,
-                    "sync_source_index": ws.app.state.sync_service.source_index,
-                    "rigctl_to_main_enabled": getattr(ws.app.state.config, "rigctl_to_main_enabled", True),
-                    "all_rigs_enabled": bool(rigs) and all(r.get("enabled", True) is not False for r in rigs),
-                }
-                if hasattr(ws.app.state.sync_service, '_task'):
-                    result["sync_service_running"] = ws.app.state.sync_service._task is not None and not ws.app.state.sync_service._task.done()
-                return result
-
-            await ws.send_json(await get_app_status())
-            while True:
-                interval = max(0.1, ws.app.state.config.poll_interval_ms / 1000.0)
-                await asyncio.sleep(interval)
-                await ws.send_json(await get_app_status())
-        except (WebSocketDisconnect, Exception): pass
+            # Unsubscribe now rather than whenever the generator is collected
+            await stream.aclose()
+
+    return StreamingResponse(
+        events(), media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -31,6 +31,13 @@ class SyncService:
                 pass
             self._task = None
 
+    @staticmethod
+    async def _refresh_caps(rig: RigClient) -> None:
+        try:
+            await rig.check_and_refresh_caps()
+        except Exception:
+            pass
+
     async def _run(self):
         interval = max(0.1, self.interval_ms / 1000.0)
         while True:
@@ -38,12 +45,9 @@ class SyncService:
                 await asyncio.sleep(interval)
                 
                 # Check and refresh capabilities for all rigs
-                for rig in self.rigs:
-                    if getattr(rig.cfg, "enabled", True):
-                        try:
-                            await rig.check_and_refresh_caps()
-                        except Exception:
-                            pass
+                await asyncio.gather(*(
+                    self._refresh_caps(rig) for rig in self.rigs if getattr(rig.cfg, "enabled", True)
+                ))
                 
                 if not self.enabled:
                     continue
@@ -1,4 +1,5 @@
 """Unit tests for app.py - ProfileManager, API endpoints, and configuration management."""
+import sys
 import pytest
 from pathlib import Path
 from fastapi.testclient import TestClient
@@ -183,6 +184,36 @@ def test_sync_all_once_only_follows_followers(client):
     assert 1 in synced
     assert 2 not in synced
 
+def test_sync_all_once_reports_failing_follower_per_rig(client, monkeypatch):
+    """One follower raising does not fail the request or the other followers."""
+    client.post("/api/rig/2/follow_main", json={"follow_main": True})
+    client.post("/api/rig/0/set", json={"frequency_hz": 14074000})
+
+    async def boom(hz):
+        raise OSError("rig unreachable")
+    monkeypatch.setattr(client.app.state.rigs[1], "set_frequency", boom)
+
+    body = client.post("/api/rig/sync_all_once", json={}).json()
+    assert body["status"] == "ok"
+    results = {x["index"]: x for x in body["results"]}
+    assert results[1] == {"index": 1, "error": "rig unreachable"}
+    assert results[2]["freq_ok"] is True
+    assert client.app.state.rigs[2].set_freq_calls[-1] == 14074000
+
+def test_sync_all_once_without_router_filters_by_config(client):
+    """Without a message router, followers come from each rig's config."""
+    client.post("/api/sync", json={"source_index": 0})
+    client.post("/api/rig/0/set", json={"frequency_hz": 14074000})
+
+    msg_router, client.app.state.router = client.app.state.router, None
+    try:
+        body = client.post("/api/rig/sync_all_once", json={}).json()
+    finally:
+        # Shutdown still stops the real router
+        client.app.state.router = msg_router
+    assert body["status"] == "ok"
+    assert [x["index"] for x in body["results"]] == [1]
+
 # ProfileManager tests from test_app_profiles.py
 class TestProfileManager:
     """Test the ProfileManager class."""
@@ -210,6 +241,22 @@ class TestProfileManager:
         assert active_file.exists()
         assert active_file.read_text().strip() == "MyProfile"
 
+    def test_persist_active_name_skips_unchanged_and_replaces_atomically(self, tmp_path):
+        """Re-persisting the stored name leaves the file alone; no tmp file lingers."""
+        active_file = tmp_path / "active_profile"
+        pm = ProfileManager(tmp_path, test_mode=False)
+        pm.active_profile_path = active_file
+
+        pm.persist_active_name("MyProfile")
+        st = active_file.stat()
+        pm.persist_active_name("MyProfile")
+        assert active_file.stat().st_mtime_ns == st.st_mtime_ns
+        assert active_file.stat().st_ino == st.st_ino
+
+        pm.persist_active_name("Other")
+        assert active_file.read_text() == "Other"
+        assert not (tmp_path / "active_profile.tmp").exists()
+
     def test_get_active_name_returns_empty_string(self, tmp_path):
         """get_active_name should return empty string when no active profile."""
         pm = ProfileManager(tmp_path, test_mode=False)
@@ -222,6 +269,17 @@ class TestProfileManager:
         (tmp_path / "active_profile").write_text("MyProfile\n")
         assert pm.get_active_name() == "MyProfile"
 
+    def test_get_active_name_rereads_after_change(self, tmp_path):
+        """get_active_name should pick up a rewritten active profile file."""
+        pm = ProfileManager(tmp_path, test_mode=False)
+        pm.active_profile_path = tmp_path / "active_profile"
+        pm.persist_active_name("First")
+        assert pm.get_active_name() == "First"
+        pm.persist_active_name("SecondProfile")
+        assert pm.get_active_name() == "SecondProfile"
+        pm.persist_active_name("")
+        assert pm.get_active_name() == ""
+
     def test_list_names_empty_in_test_mode(self):
         """list_names should return empty list when no profiles exist."""
         pm = ProfileManager(Path("/tmp/test"), test_mode=True)
@@ -239,6 +297,41 @@ class TestProfileManager:
         names = pm.list_names()
         assert names == ["a_profile", "z_profile"]
 
+    def test_list_names_rescans_only_when_dir_changes(self, tmp_path, monkeypatch):
+        """list_names/exists should reuse one scan until the directory changes."""
+        import multirig.profiles as profilesmod
+        pm = ProfileManager(tmp_path / "multirig.config.yaml", test_mode=False)
+        assert pm.list_names() == []
+        pm.save_data("b", {})
+        (pm.profiles_dir / "a.yml").write_text("")
+        (pm.profiles_dir / "notes.txt").write_text("")
+
+        scans = []
+        real = profilesmod.os.scandir
+        monkeypatch.setattr(profilesmod.os, "scandir", lambda d: scans.append(d) or real(d))
+        assert pm.list_names() == ["a", "b"]
+        assert pm.exists("a") and not pm.exists("notes")
+        assert len(scans) == 1
+
+        pm.delete("a")
+        assert pm.list_names() == ["b"]
+        assert len(scans) == 2
+
+    def test_rename_resolves_yml_source_from_scan(self, tmp_path):
+        """rename should keep a .yml profile's suffix and refuse existing targets."""
+        pm = ProfileManager(tmp_path / "multirig.config.yaml", test_mode=False)
+        pm.profiles_dir.mkdir()
+        (pm.profiles_dir / "old.yml").write_text("rigs: []\n")
+        pm.save_data("taken", {})
+
+        with pytest.raises(FileExistsError):
+            pm.rename("old", "taken")
+        pm.rename("old", "new")
+        assert (pm.profiles_dir / "new.yml").exists()
+        assert pm.list_names() == ["new", "taken"]
+        with pytest.raises(FileNotFoundError):
+            pm.rename("old", "other")
+
     def test_exists_returns_false_for_nonexistent(self):
         """exists should return False for non-existent profile."""
         pm = ProfileManager(Path("/tmp/test"), test_mode=True)
@@ -263,6 +356,97 @@ class TestProfileManager:
         pm._memory_store["TestProfile"] = test_data
         assert pm.load_data("TestProfile") == test_data
 
+    def test_export_yaml_is_cached_until_file_changes(self, tmp_path, monkeypatch):
+        """export_yaml should dump an unchanged profile once."""
+        import multirig.profiles as profilesmod
+        pm = ProfileManager(tmp_path / "multirig.config.yaml", test_mode=False)
+        pm.save_data("P", {"rigs": [{"name": "A"}]})
+
+        dumps = []
+        real = profilesmod.dump_yaml_bytes
+        monkeypatch.setattr(profilesmod, "dump_yaml_bytes", lambda d: dumps.append(1) or real(d))
+
+        first = pm.export_yaml("P")
+        assert pm.export_yaml("P") is first
+        assert len(dumps) == 1
+        pm.load_data("P")["rigs"].clear()
+        assert pm.export_yaml("P") == real({"rigs": [{"name": "A"}]})
+
+        pm.save_data("P", {"rigs": [{"name": "B"}]})
+        assert b"name: B" in pm.export_yaml("P")
+        with pytest.raises(FileNotFoundError):
+            pm.export_yaml("missing")
+
+    def test_load_data_uses_json_sidecar_until_yaml_is_edited(self, tmp_path, monkeypatch):
+        """A fresh manager reads the JSON sidecar; hand-edited YAML wins."""
+        import multirig.profiles as profilesmod
+        pm = ProfileManager(tmp_path / "multirig.config.yaml", test_mode=False)
+        pm.save_data("P", {"rigs": [{"name": "A"}]})
+        yaml_path = pm.profiles_dir / "P.yaml"
+        assert (pm.profiles_dir / "P.yaml.cache.json").exists()
+        assert pm.list_names() == ["P"]
+
+        monkeypatch.setattr(profilesmod, "load_yaml", lambda b: pytest.fail("YAML should not be parsed"))
+        fresh = ProfileManager(tmp_path / "multirig.config.yaml", test_mode=False)
+        assert fresh.load_data("P") == {"rigs": [{"name": "A"}]}
+
+        monkeypatch.undo()
+        yaml_path.write_text(yaml_path.read_text().replace("name: A", "name: Edited"))
+        fresh = ProfileManager(tmp_path / "multirig.config.yaml", test_mode=False)
+        assert fresh.load_data("P") == {"rigs": [{"name": "Edited"}]}
+
+        fresh.rename("P", "Q")
+        assert (pm.profiles_dir / "Q.yaml.cache.json").exists()
+        assert fresh.delete("Q")
+        assert list(pm.profiles_dir.iterdir()) == []
+
+    def test_profile_caches_survive_concurrent_threads(self, tmp_path):
+        """Concurrent loads, saves and listings don't corrupt the shared caches."""
+        from concurrent.futures import ThreadPoolExecutor
+        import multirig.profiles as profilesmod
+        pm = ProfileManager(tmp_path / "multirig.config.yaml", test_mode=False)
+        names = [f"P{i}" for i in range(profilesmod._PROFILE_CACHE_MAX + 8)]
+        for n in names:
+            pm.save_data(n, {"name": n})
+
+        def churn(i):
+            n = names[i % len(names)]
+            if i % 7 == 0:
+                pm.save_data(n, {"name": n})
+            assert pm.load_data(n) == {"name": n}
+            pm.export_yaml(n)
+            assert n in pm.list_names()
+
+        with ThreadPoolExecutor(8) as pool:
+            list(pool.map(churn, range(400)))
+        assert len(pm._cache) <= profilesmod._PROFILE_CACHE_MAX
+
+    def test_load_data_caches_until_file_changes(self, tmp_path, monkeypatch):
+        """load_data should parse an unchanged file once and hand out copies."""
+        import multirig.profiles as profilesmod
+        pm = ProfileManager(tmp_path / "multirig.config.yaml", test_mode=False)
+        pm.save_data("P", {"rigs": [{"name": "A"}]})
+
+        parses = []
+        real = profilesmod.load_yaml
+        monkeypatch.setattr(profilesmod, "load_yaml", lambda b: parses.append(1) or real(b))
+        # Exercise the in-memory cache on its own
+        monkeypatch.setattr(profilesmod, "_read_sidecar", lambda path, yaml_bytes: None)
+
+        first = pm.load_data("P")
+        first["rigs"][0]["name"] = "mutated"
+        assert pm.load_data("P") == {"rigs": [{"name": "A"}]}
+        assert len(parses) == 1
+
+        pm.save_data("P", {"rigs": [{"name": "B"}]})
+        assert pm.load_data("P") == {"rigs": [{"name": "B"}]}
+        assert len(parses) == 2
+
+        pm.rename("P", "Q")
+        assert pm.load_data("Q") == {"rigs": [{"name": "B"}]}
+        with pytest.raises(FileNotFoundError):
+            pm.load_data("P")
+
     def test_save_data_stores_in_memory(self):
         """save_data should store data in memory when in test_mode."""
         pm = ProfileManager(Path("/tmp/test"), test_mode=True)
@@ -302,6 +486,8 @@ class TestProfileManager:
         assert pm.is_valid_name("Valid_Name")
         assert pm.is_valid_name("Profile123")
         assert pm.is_valid_name("Test-Profile")
+        assert pm.is_valid_name("x" * 100)
+        assert not pm.is_valid_name("x" * 101)
 
 def test_profile_manager_file_operations(tmp_path):
     """Test ProfileManager file operations outside of test_mode."""
@@ -458,6 +644,16 @@ def test_set_all_rigs_enabled(client):
     assert data["status"] == "ok"
     assert data["enabled"] is False
 
+def test_set_all_rigs_enabled_skips_save_when_unchanged(client, monkeypatch):
+    import multirig.routes as routesmod
+    saves = []
+    monkeypatch.setattr(routesmod, "schedule_config_save", lambda app: saves.append(app))
+    client.post("/api/rig/enabled_all", json={"enabled": False})
+    client.post("/api/rig/enabled_all", json={"enabled": False})
+    assert len(saves) == 1
+    assert all(r.enabled is False for r in client.app.state.config.rigs)
+    assert all(r.cfg.enabled is False for r in client.app.state.rigs)
+
 def test_sync_settings(client):
     """Test updating sync settings."""
     response = client.post("/api/sync", json={"enabled": False, "source_index": 1})
@@ -483,6 +679,51 @@ def test_get_status(client):
     assert "rigs" in data
     assert isinstance(data["rigs"], list)
 
+def test_get_status_reuses_router_snapshot(client):
+    calls = []
+    for rig in client.app.state.rigs:
+        orig = rig.safe_status
+        async def counted(orig=orig):
+            calls.append(1)
+            return await orig()
+        rig.safe_status = counted
+    msg_router = client.app.state.router
+    msg_router.poll_interval_ms = 60_000
+    msg_router.invalidate_status()
+    n = len(client.app.state.rigs)
+
+    client.get("/api/status")
+    client.get("/api/status")
+    assert len(calls) == n
+
+    # Config writes drop the snapshot; sync flags are always read live
+    client.post("/api/rig/0/enabled", json={"enabled": False})
+    client.post("/api/sync", json={"enabled": False})
+    data = client.get("/api/status").json()
+    assert len(calls) == 2 * n
+    assert data["rigs"][0]["enabled"] is False
+    assert data["sync_enabled"] is False
+
+def test_get_status_reuses_encoded_body_for_same_snapshot(client, monkeypatch):
+    """Polls within one router snapshot are encoded once; live flags re-encode."""
+    import multirig.routes as routesmod
+
+    encodes = []
+    real = routesmod._json_bytes
+    monkeypatch.setattr(routesmod, "_json_bytes", lambda data: encodes.append(1) or real(data))
+    monkeypatch.setattr(routesmod, "_status_body_cache", None)
+    client.app.state.router.poll_interval_ms = 60_000
+    client.app.state.router.invalidate_status()
+
+    first = client.get("/api/status")
+    assert first.headers["content-type"] == "application/json"
+    assert client.get("/api/status").content == first.content
+    assert len(encodes) == 1
+
+    client.app.state.router.sync_enabled = not first.json()["sync_enabled"]
+    assert client.get("/api/status").json()["sync_enabled"] is not first.json()["sync_enabled"]
+    assert len(encodes) == 2
+
 def test_get_bind_addrs(client):
     """Test getting available bind addresses."""
     response = client.get("/api/bind_addrs")
@@ -492,6 +733,123 @@ def test_get_bind_addrs(client):
     # Should include localhost and 0.0.0.0
     assert "127.0.0.1" in data or "0.0.0.0" in data
 
+def test_get_bind_addrs_is_cached(client, monkeypatch):
+    """Interface enumeration is reused within the TTL."""
+    import multirig.routes as routesmod
+
+    calls = []
+    monkeypatch.setattr(routesmod, "_bind_addrs_cache", None)
+    monkeypatch.setattr(routesmod, "_enumerate_bind_addrs", lambda: calls.append(1) or ["0.0.0.0", "10.0.0.5"])
+
+    assert client.get("/api/bind_addrs").json() == ["0.0.0.0", "10.0.0.5"]
+    assert client.get("/api/bind_addrs").json() == ["0.0.0.0", "10.0.0.5"]
+    assert len(calls) == 1
+
+    monkeypatch.setattr(routesmod, "BIND_ADDRS_TTL_S", 0.0)
+    client.get("/api/bind_addrs")
+    assert len(calls) == 2
+
+def test_refresh_bind_addrs_forces_enumeration(client, monkeypatch):
+    """POST /api/bind_addrs/refresh bypasses the TTL cache."""
+    import multirig.routes as routesmod
+
+    found = [["0.0.0.0"], ["0.0.0.0", "10.0.0.7"]]
+    monkeypatch.setattr(routesmod, "_bind_addrs_cache", None)
+    monkeypatch.setattr(routesmod, "_enumerate_bind_addrs", lambda: found.pop(0))
+
+    assert client.get("/api/bind_addrs").json() == ["0.0.0.0"]
+    assert client.post("/api/bind_addrs/refresh").json() == ["0.0.0.0", "10.0.0.7"]
+    assert client.get("/api/bind_addrs").json() == ["0.0.0.0", "10.0.0.7"]
+
+@pytest.mark.asyncio
+async def test_get_bind_addrs_shares_one_enumeration_on_concurrent_miss(monkeypatch):
+    """Requests that miss the cache together wait on a single enumeration."""
+    import asyncio
+    import time
+    from types import SimpleNamespace
+    import multirig.routes as routesmod
+
+    calls = []
+
+    def slow_enumerate():
+        calls.append(1)
+        time.sleep(0.05)
+        return ["0.0.0.0", "127.0.0.1"]
+
+    monkeypatch.setattr(routesmod, "_bind_addrs_cache", None)
+    monkeypatch.setattr(routesmod, "_enumerate_bind_addrs", slow_enumerate)
+    request = SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace()))
+
+    results = await asyncio.gather(*(routesmod.get_bind_addrs(request) for _ in range(5)))
+    assert results == [["0.0.0.0", "127.0.0.1"]] * 5
+    assert len(calls) == 1
+
+def test_get_bind_addrs_works_across_event_loops(monkeypatch):
+    """A finished loop's in-flight future never leaks into the next app's loop."""
+    import asyncio
+    from types import SimpleNamespace
+    import multirig.routes as routesmod
+
+    monkeypatch.setattr(routesmod, "_enumerate_bind_addrs", lambda: ["0.0.0.0"])
+    for _ in range(2):
+        monkeypatch.setattr(routesmod, "_bind_addrs_cache", None)
+        request = SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace()))
+        assert asyncio.run(routesmod.get_bind_addrs(request)) == ["0.0.0.0"]
+
+def test_enumerate_bind_addrs_prefers_psutil(monkeypatch):
+    """psutil's interface table is used instead of spawning ifconfig or resolving the hostname."""
+    import socket
+    from types import SimpleNamespace
+    import multirig.routes as routesmod
+
+    fake_psutil = SimpleNamespace(net_if_addrs=lambda: {
+        "eth0": [SimpleNamespace(family=socket.AF_INET, address="10.0.0.5"),
+                 SimpleNamespace(family=socket.AF_INET6, address="fe80::1")],
+    })
+    monkeypatch.setattr(routesmod, "psutil", fake_psutil)
+
+    def no_lookup(name):
+        raise AssertionError("hostname should not be resolved")
+    monkeypatch.setattr(routesmod.socket, "gethostbyname_ex", no_lookup)
+
+    def no_subprocess(*args, **kwargs):
+        raise AssertionError("ifconfig should not be spawned")
+    monkeypatch.setattr(routesmod.subprocess, "check_output", no_subprocess)
+
+    assert routesmod._enumerate_bind_addrs() == ["0.0.0.0", "10.0.0.5", "127.0.0.1"]
+
+def test_enumerate_bind_addrs_without_psutil_parses_ifconfig(monkeypatch):
+    """Without psutil, every inet address ifconfig lists is offered, aliases included."""
+    import multirig.routes as routesmod
+
+    out = (
+        b"eth0: flags=4163<UP,BROADCAST,RUNNING,MULTICAST>  mtu 1500\n"
+        b"        inet 192.168.1.10  netmask 255.255.255.0\n"
+        b"        inet6 fe80::1  prefixlen 64\n"
+        b"eth0:1: flags=4163<UP,BROADCAST,RUNNING,MULTICAST>  mtu 1500\n"
+        b"        inet 192.168.1.11  netmask 255.255.255.0\n"
+    )
+    monkeypatch.setattr(routesmod, "psutil", None)
+    monkeypatch.setattr(routesmod.socket, "gethostbyname_ex", lambda host: (host, [], ["10.0.0.5"]))
+    monkeypatch.setattr(routesmod.subprocess, "check_output", lambda *a, **kw: out)
+
+    assert routesmod._enumerate_bind_addrs() == [
+        "0.0.0.0", "10.0.0.5", "127.0.0.1", "192.168.1.10", "192.168.1.11",
+    ]
+
+def test_list_serial_ports_is_cached(client, monkeypatch):
+    """Serial port enumeration is reused within the TTL."""
+    import multirig.routes as routesmod
+
+    calls = []
+    ports = [{"device": "/dev/ttyUSB0", "description": "IC-7300", "hwid": "USB"}]
+    monkeypatch.setattr(routesmod, "_serial_ports_cache", None)
+    monkeypatch.setattr(routesmod, "_enumerate_serial_ports", lambda: calls.append(1) or ports)
+
+    assert client.get("/api/serial-ports").json() == {"status": "ok", "ports": ports}
+    assert client.get("/api/serial-ports").json()["ports"] == ports
+    assert len(calls) == 1
+
 def test_set_rig_mode(client):
     """Test setting rig mode."""
     response = client.post("/api/rig/a/set", json={"mode": "USB"})
@@ -512,3 +870,429 @@ def test_sync_rig_from_source(client):
     assert response.status_code == 200
     data = response.json()
     assert data["status"] == "ok"
+
+def test_ws_sends_status_as_json_text(client):
+    """Test the WebSocket pushes the initial status as a JSON text frame."""
+    with client.websocket_connect("/ws") as ws:
+        data = ws.receive_json()
+    assert [r["name"] for r in data["rigs"]] == ["Main", "Follower", "Manual"]
+    assert data["sync_source_index"] == 0
+
+def test_ws_polls_rigs_without_router(client):
+    """Without a message router the WebSocket falls back to polling the rigs."""
+    msg_router, client.app.state.router = client.app.state.router, None
+    try:
+        with client.websocket_connect("/ws") as ws:
+            data = ws.receive_json()
+    finally:
+        # Shutdown still stops the real router
+        client.app.state.router = msg_router
+    assert [r["name"] for r in data["rigs"]] == ["Main", "Follower", "Manual"]
+    assert data["sync_source_index"] == 0
+
+@pytest.mark.asyncio
+async def test_sse_status_streams_status_events(client):
+    """/sse/status emits the shared status frames as SSE events."""
+    import json
+    from types import SimpleNamespace
+    from multirig.routes import sse_status
+
+    request = SimpleNamespace(app=client.app)
+    response = await sse_status(request)
+    assert response.media_type == "text/event-stream"
+    events = response.body_iterator
+    try:
+        chunk = await events.__anext__()
+    finally:
+        await events.aclose()
+    assert chunk.startswith("event: status\ndata: ") and chunk.endswith("\n\n")
+    data = json.loads(chunk.split("data: ", 1)[1])
+    assert [r["name"] for r in data["rigs"]] == ["Main", "Follower", "Manual"]
+    assert not client.app.state.router._ws_subscribers
+
+def test_get_config_etag_and_invalidation(client):
+    """GET /api/config serves cached bytes with an ETag and honours If-None-Match."""
+    r1 = client.get("/api/config")
+    assert r1.status_code == 200
+    assert r1.json()["rigs"][0]["name"] == "Main"
+    etag = r1.headers["etag"]
+
+    r2 = client.get("/api/config", headers={"If-None-Match": etag})
+    assert r2.status_code == 304
+
+    # In-place config changes invalidate the cached body
+    client.post("/api/sync", json={"enabled": False})
+    r3 = client.get("/api/config", headers={"If-None-Match": etag})
+    assert r3.status_code == 200
+    assert r3.headers["etag"] != etag
+    assert r3.json()["sync_enabled"] is False
+
+def test_export_config_yaml_is_cached_until_config_changes(client, monkeypatch):
+    """The YAML export is encoded once per config version."""
+    import multirig.routes as routesmod
+
+    dumps = []
+    real = routesmod.dump_yaml_bytes
+    monkeypatch.setattr(routesmod, "dump_yaml_bytes", lambda data: dumps.append(1) or real(data))
+
+    first = client.get("/api/config/export").text
+    assert client.get("/api/config/export").text == first
+    assert len(dumps) == 1
+
+    client.post("/api/rig/0/follow_main", json={"follow_main": False})
+    assert client.get("/api/config/export").text != first
+    assert len(dumps) == 2
+
+def test_config_dump_is_cached_until_config_changes(client):
+    from multirig.core import config_dump
+    app = client.app
+    first = config_dump(app)
+    assert config_dump(app) is first
+    client.post("/api/config/profiles/Snap", json={})
+    assert config_dump(app) is first
+
+    client.post("/api/rig/0/follow_main", json={"follow_main": False})
+    second = config_dump(app)
+    assert second is not first
+    assert second["rigs"][0]["follow_main"] is False
+
+def test_export_config_yaml_honours_if_none_match(client):
+    r1 = client.get("/api/config/export")
+    etag = r1.headers["etag"]
+
+    r2 = client.get("/api/config/export", headers={"If-None-Match": etag})
+    assert r2.status_code == 304
+    assert r2.content == b""
+
+    client.post("/api/rig/0/follow_main", json={"follow_main": False})
+    r3 = client.get("/api/config/export", headers={"If-None-Match": etag})
+    assert r3.status_code == 200
+    assert r3.headers["etag"] != etag
+
+@pytest.mark.asyncio
+async def test_schedule_config_save_coalesces_and_flushes(monkeypatch, tmp_path):
+    """Bursts of toggles produce one debounced save; flush writes a pending save now."""
+    import asyncio
+    from types import SimpleNamespace
+    import multirig.core as coremod
+
+    saves = []
+
+    async def fake_save(cfg, path):
+        saves.append(cfg)
+    monkeypatch.setattr(coremod, "save_config_async", fake_save)
+    app = SimpleNamespace(state=SimpleNamespace(config="cfg", config_path=tmp_path / "c.yaml"))
+
+    for _ in range(5):
+        coremod.schedule_config_save(app, delay=0.01)
+    await asyncio.sleep(0.05)
+    assert saves == ["cfg"]
+
+    coremod.schedule_config_save(app, delay=10)
+    await coremod.flush_config_save(app)
+    assert saves == ["cfg", "cfg"]
+
+@pytest.mark.asyncio
+async def test_flush_config_save_waits_for_in_flight_write(monkeypatch, tmp_path):
+    """Flushing while a debounced save is writing does not start a second, overlapping write."""
+    import asyncio
+    from types import SimpleNamespace
+    import multirig.core as coremod
+
+    active, overlaps, saves = [], [], []
+
+    async def slow_save(cfg, path):
+        if active:
+            overlaps.append(cfg)
+        active.append(cfg)
+        await asyncio.sleep(0.05)
+        active.pop()
+        saves.append(cfg)
+    monkeypatch.setattr(coremod, "save_config_async", slow_save)
+    app = SimpleNamespace(state=SimpleNamespace(config="cfg", config_path=tmp_path / "c.yaml"))
+
+    coremod.schedule_config_save(app, delay=0.0)
+    await asyncio.sleep(0.01)  # the save is now writing
+    await coremod.flush_config_save(app)
+    assert saves == ["cfg"]
+    assert overlaps == []
+
+@pytest.mark.asyncio
+async def test_config_change_during_save_write_is_saved_again(monkeypatch, tmp_path):
+    """A change that lands while the debounced save is writing triggers another save."""
+    import asyncio
+    from types import SimpleNamespace
+    import multirig.core as coremod
+
+    saves = []
+
+    async def slow_save(cfg, path):
+        snapshot = dict(cfg)
+        await asyncio.sleep(0.05)
+        saves.append(snapshot)
+    monkeypatch.setattr(coremod, "save_config_async", slow_save)
+    app = SimpleNamespace(state=SimpleNamespace(config={"v": 1}, config_path=tmp_path / "c.yaml"))
+
+    coremod.schedule_config_save(app, delay=0.0)
+    await asyncio.sleep(0.01)  # the first save is now writing
+    app.state.config["v"] = 2
+    coremod.schedule_config_save(app, delay=0.0)
+    await asyncio.sleep(0.2)
+    assert saves == [{"v": 1}, {"v": 2}]
+    assert app.state.config_save_task.done()
+
+@pytest.mark.asyncio
+async def test_apply_config_save_waits_for_debounced_write(monkeypatch, tmp_path):
+    """Direct saves and debounced saves share one lock, so they never overlap."""
+    import asyncio
+    from types import SimpleNamespace
+    import multirig.core as coremod
+
+    active, overlaps = [], []
+
+    async def slow_save(cfg, path):
+        if active:
+            overlaps.append(cfg)
+        active.append(cfg)
+        await asyncio.sleep(0.03)
+        active.pop()
+    monkeypatch.setattr(coremod, "save_config_async", slow_save)
+    app = SimpleNamespace(state=SimpleNamespace(config="old", config_path=tmp_path / "c.yaml"))
+
+    coremod.schedule_config_save(app, delay=0.0)
+    await asyncio.sleep(0.01)
+    await coremod.save_app_config(app, "new")
+    await coremod.flush_config_save(app)
+    assert overlaps == []
+
+def test_atomic_write_bytes_uses_unique_temp_files(tmp_path, monkeypatch):
+    """Concurrent writers each get their own temporary file."""
+    import os
+    import threading
+    from multirig.config import atomic_write_bytes
+
+    target = tmp_path / "c.yaml"
+    temps = []
+    real_replace = os.replace
+
+    def spy_replace(src, dst):
+        temps.append(src)
+        real_replace(src, dst)
+    monkeypatch.setattr(os, "replace", spy_replace)
+
+    threads = [threading.Thread(target=atomic_write_bytes, args=(target, b"x" * 1000 * i)) for i in range(1, 9)]
+    for t in threads: t.start()
+    for t in threads: t.join()
+
+    assert len(set(temps)) == 8
+    assert len(target.read_bytes()) % 1000 == 0
+    assert [p.name for p in tmp_path.iterdir()] == ["c.yaml"]
+
+@pytest.mark.asyncio
+async def test_close_rigs_runs_concurrently_and_ignores_errors():
+    """close_rigs closes every rig even when one close raises."""
+    import asyncio
+    from multirig.core import close_rigs
+
+    closed = []
+
+    class Rig:
+        def __init__(self, name, fail=False):
+            self.name, self.fail = name, fail
+
+        async def close(self):
+            await asyncio.sleep(0.01)
+            if self.fail:
+                raise OSError("timeout")
+            closed.append(self.name)
+
+    await close_rigs([Rig("a"), Rig("b", fail=True), Rig("c")])
+    assert sorted(closed) == ["a", "c"]
+
+@pytest.mark.asyncio
+async def test_schedule_rig_close_tracks_task_and_times_out(monkeypatch):
+    """Background closes are tracked until done and bounded by a timeout."""
+    import asyncio
+    from types import SimpleNamespace
+    import multirig.core as coremod
+
+    class Rig:
+        def __init__(self, delay):
+            self.delay, self.closed = delay, False
+
+        async def close(self):
+            await asyncio.sleep(self.delay)
+            self.closed = True
+
+    monkeypatch.setattr(coremod, "RIG_CLOSE_TIMEOUT_S", 0.05)
+    app = SimpleNamespace(state=SimpleNamespace(rig_close_tasks=set()))
+    fast, stuck = Rig(0.0), Rig(10.0)
+    coremod.schedule_rig_close(app, [fast, stuck])
+    assert len(app.state.rig_close_tasks) == 1
+
+    await asyncio.wait_for(coremod.drain_rig_closes(app), 1.0)
+    await asyncio.sleep(0)
+    assert fast.closed and not stuck.closed
+    assert app.state.rig_close_tasks == set()
+
+def test_ws_sends_msgpack_when_requested(client):
+    """Test clients can opt in to MessagePack binary frames."""
+    msgpack = pytest.importorskip("msgpack")
+    with client.websocket_connect("/ws?format=msgpack") as ws:
+        data = msgpack.unpackb(ws.receive_bytes())
+    assert [r["name"] for r in data["rigs"]] == ["Main", "Follower", "Manual"]
+
+def test_encode_status_frame_reuses_frame_for_shared_status():
+    """Subscribers of the same broadcast share one encoded frame."""
+    import json
+    from multirig.routes import _encode_status_frame
+    status = {"rigs": [], "sync_enabled": True}
+    first = _encode_status_frame(status, "default")
+    assert _encode_status_frame(status, "default") is first
+    assert json.loads(first) == {"rigs": [], "sync_enabled": True, "active_profile": "default"}
+    # A new snapshot or profile name produces a fresh frame
+    assert json.loads(_encode_status_frame(status, "contest"))["active_profile"] == "contest"
+    assert _encode_status_frame(dict(status), "contest") is not first
+
+def test_update_config_rejects_invalid_body(client):
+    """Invalid config bodies are rejected with a 422 validation error."""
+    response = client.post("/api/config", json={"rigs": [{"port": "not-a-port"}]})
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"][0] == "body"
+    assert response.json()["detail"][0]["loc"][-1] == "port"
+
+    response = client.post("/api/config", content=b"{not json", headers={"content-type": "application/json"})
+    assert response.status_code == 422
+
+def test_update_config_reuses_unchanged_rigs(client):
+    """POST /api/config only replaces rig clients whose config changed."""
+    app = client.app
+    before = list(app.state.rigs)
+    cfg = app.state.config.model_dump()
+    cfg["poll_interval_ms"] = 500
+    cfg["rigs"][1]["port"] = 4999
+    cfg["rigs"].pop()
+
+    assert client.post("/api/config", json=cfg).status_code == 200
+
+    after = app.state.rigs
+    assert len(after) == 2
+    assert after[0] is before[0]
+    assert after[0].cfg is app.state.config.rigs[0]
+    assert after[1] is not before[1]
+    assert after[1].cfg.port == 4999
+
+def test_update_config_keeps_client_when_connection_unchanged(client, monkeypatch):
+    """Cosmetic or enabled edits keep the rig client; disabling closes it."""
+    app = client.app
+    before = list(app.state.rigs)
+    closed = []
+
+    async def close():
+        closed.append(1)
+    monkeypatch.setattr(before[0], "close", close)
+    cfg = app.state.config.model_dump()
+    cfg["rigs"][0]["name"] = "Renamed"
+    cfg["rigs"][0]["color"] = "#123456"
+    cfg["rigs"][0]["enabled"] = False
+
+    assert client.post("/api/config", json=cfg).status_code == 200
+
+    assert app.state.rigs == before
+    assert app.state.rigs[0].cfg is app.state.config.rigs[0]
+    assert app.state.rigs[0].cfg.name == "Renamed"
+    assert closed == [1]
+
+def test_update_config_does_not_start_legacy_sync_service(client, monkeypatch):
+    """Only the router polls rigs; applying a config must not start SyncService."""
+    started = []
+
+    async def start():
+        started.append(1)
+    monkeypatch.setattr(client.app.state.sync_service, "start", start)
+
+    cfg = client.app.state.config.model_dump()
+    cfg["poll_interval_ms"] = 500
+    assert client.post("/api/config", json=cfg).status_code == 200
+    assert client.app.state.sync_service.interval_ms == 500
+    assert started == []
+
+def test_update_config_reuses_reordered_rigs_and_rigctl_listener(client):
+    """Rigs are matched by config, and an unchanged rigctl listener is kept."""
+    app = client.app
+    before = list(app.state.rigs)
+    app.state.rigctl_server.running = True
+    server = app.state.rigctl_server
+    cfg = app.state.config.model_dump()
+    cfg["rigs"] = [cfg["rigs"][2], cfg["rigs"][0]]
+
+    assert client.post("/api/config", json=cfg).status_code == 200
+
+    assert app.state.rigs == [before[2], before[0]]
+    assert app.state.rigctl_server is server
+
+    cfg["rigctl_listen_port"] = server.port + 1
+    assert client.post("/api/config", json=cfg).status_code == 200
+    assert app.state.rigctl_server is not server
+
+def test_settings_page_template_render_is_cached(client, monkeypatch):
+    """The Jinja settings fallback renders once per distinct config."""
+    import multirig.routes as routesmod
+
+    renders = []
+    real = routesmod.templates.TemplateResponse
+    monkeypatch.setattr(routesmod, "_serve_react_app", lambda: None)
+    monkeypatch.setattr(routesmod.templates, "TemplateResponse", lambda *a, **kw: renders.append(1) or real(*a, **kw))
+
+    first = client.get("/settings")
+    assert first.status_code == 200
+    assert client.get("/settings").text == first.text
+    assert len(renders) == 1
+
+    client.post("/api/sync", json={"enabled": False})
+    client.get("/settings")
+    assert len(renders) == 2
+
+def test_index_template_render_is_cached_with_stable_assets_ts(client, monkeypatch):
+    """The Jinja index fallback renders once and stamps assets by file mtime."""
+    import re
+    import multirig.routes as routesmod
+
+    renders = []
+    real = routesmod.templates.TemplateResponse
+    monkeypatch.setattr(routesmod, "_serve_react_app", lambda: None)
+    monkeypatch.setattr(routesmod, "_index_html_cache", None)
+    monkeypatch.setattr(routesmod, "_assets_ts_value", None)
+    monkeypatch.setattr(routesmod.templates, "TemplateResponse", lambda *a, **kw: renders.append(1) or real(*a, **kw))
+
+    first = client.get("/")
+    assert first.status_code == 200
+    assert client.get("/").text == first.text
+    assert len(renders) == 1
+
+    ts = int(re.search(r"style\.css\?ts=(\d+)", first.text).group(1))
+    newest = max((routesmod.STATIC_DIR / n).stat().st_mtime_ns for n in routesmod._TEMPLATE_ASSETS)
+    assert ts == newest // 1_000_000
+
+def test_update_config_documents_request_body(client):
+    """The raw-body config route still publishes the AppConfig schema."""
+    spec = client.app.openapi()
+    body = spec["paths"]["/api/config"]["post"]["requestBody"]
+    schema = body["content"]["application/json"]["schema"]
+    assert body["required"] is True
+    assert "rigs" in schema["properties"]
+    # Every $ref resolves inside the document
+    def refs(node):
+        if isinstance(node, dict):
+            if "$ref" in node:
+                yield node["$ref"]
+            for value in node.values():
+                yield from refs(value)
+        elif isinstance(node, list):
+            for value in node:
+                yield from refs(value)
+
+    for ref in refs(spec):
+        node = spec
+        for part in ref.removeprefix("#/").split("/"):
+            node = node[part.replace("~1", "/").replace("~0", "~")]
@@ -94,9 +94,9 @@ def test_config_endpoint_update_error(mock_cfg):
     # Actually routes.py does `from .config import ... save_config`
     # So we must patch `multirig.routes.save_config` or `multirig.core.save_config` depending on usage.
     # Update config endpoint uses apply_config from core. core uses save_config from config.
-    # core.py: `from .config import AppConfig, save_config`
-    # So patch multirig.core.save_config
-    with patch("multirig.core.save_config", side_effect=Exception("Save fail")):
-        # The endpoint calls _apply_config which calls save_config
+    # core.py: `from .config import AppConfig, save_config_async`
+    # So patch multirig.core.save_config_async
+    with patch("multirig.core.save_config_async", side_effect=Exception("Save fail")):
+        # The endpoint calls _apply_config which calls save_config_async
         resp = client.post("/api/config", json={"rigs": []})
         assert resp.status_code == 500
@@ -6,8 +6,11 @@ from multirig.config import (
     BandPreset,
     _band_limits,
     detect_bands_from_ranges,
+    dump_yaml,
+    dump_yaml_bytes,
     parse_dump_state_ranges,
     load_config,
+    save_config,
 )
 
 
@@ -75,3 +78,52 @@ def test_load_config_creates_default_if_missing(tmp_path, monkeypatch):
     monkeypatch.setenv("MULTIRIG_TEST_MODE", "1")
     cfg = load_config(cfg_path)
     assert cfg.rigs
+
+
+def test_load_config_cache_returns_copies_and_tracks_file_changes(tmp_path, monkeypatch):
+    cfg_path = tmp_path / "cfg.yaml"
+    cfg_path.write_text("poll_interval_ms: 250\n")
+    monkeypatch.delenv("MULTIRIG_TEST_MODE", raising=False)
+
+    first = load_config(cfg_path)
+    first.poll_interval_ms = 999
+    second = load_config(cfg_path)
+    assert second is not first
+    assert second.poll_interval_ms == 250
+
+    # A rewritten file (different size) is re-parsed
+    cfg_path.write_text("poll_interval_ms: 1250\n")
+    assert load_config(cfg_path).poll_interval_ms == 1250
+
+    # save_config invalidates the entry for its path
+    second.poll_interval_ms = 500
+    save_config(second, cfg_path)
+    assert load_config(cfg_path).poll_interval_ms == 500
+
+
+def test_load_config_prefers_matching_json_sidecar(tmp_path, monkeypatch):
+    import multirig.config as config_mod
+
+    cfg_path = tmp_path / "cfg.yaml"
+    monkeypatch.delenv("MULTIRIG_TEST_MODE", raising=False)
+    cfg = config_mod.AppConfig(poll_interval_ms=321)
+    save_config(cfg, cfg_path)
+    sidecar = tmp_path / "cfg.yaml.cache.json"
+    assert sidecar.exists()
+
+    # With a fresh process-level cache, the sidecar is used instead of YAML
+    config_mod._clear_config_cache()
+    monkeypatch.setattr(config_mod, "load_yaml", lambda text: pytest.fail("YAML should not be parsed"))
+    assert load_config(cfg_path).poll_interval_ms == 321
+
+    # Editing the YAML by hand makes the sidecar stale
+    monkeypatch.undo()
+    monkeypatch.delenv("MULTIRIG_TEST_MODE", raising=False)
+    cfg_path.write_text(cfg_path.read_text().replace("poll_interval_ms: 321", "poll_interval_ms: 654"))
+    config_mod._clear_config_cache()
+    assert load_config(cfg_path).poll_interval_ms == 654
+
+
+def test_dump_yaml_bytes_matches_encoded_text():
+    data = {"rigs": [{"name": "Rig ü", "port": 4532}], "sync_enabled": True}
+    assert dump_yaml_bytes(data) == dump_yaml(data).encode("utf-8")
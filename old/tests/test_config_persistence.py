@@ -1,7 +1,7 @@
 import os
 import pytest
 import yaml
-from multirig.config import load_config, save_config, AppConfig
+from multirig.config import load_config, save_config, AppConfig, _migrate_config
 
 def test_config_test_mode(tmp_path):
     config_file = tmp_path / "test_config.yaml"
@@ -47,3 +47,23 @@ def test_config_normal_mode(tmp_path):
     
     content = yaml.safe_load(config_file.read_text())
     assert content["poll_interval_ms"] == 500, "File SHOULD change in normal mode"
+
+
+@pytest.mark.asyncio
+async def test_save_config_async_writes_atomically(tmp_path, monkeypatch):
+    monkeypatch.delenv("MULTIRIG_TEST_MODE", raising=False)
+    from multirig.config import save_config_async
+    config_file = tmp_path / "async.yaml"
+    cfg = AppConfig()
+    cfg.poll_interval_ms = 750
+
+    await save_config_async(cfg, config_file)
+
+    assert yaml.safe_load(config_file.read_text())["poll_interval_ms"] == 750
+    assert not (tmp_path / "async.yaml.tmp").exists()
+    assert load_config(config_file).poll_interval_ms == 750
+
+
+def test_migrate_config_returns_current_schema_unchanged():
+    data = {"rigs": [{"name": "A"}], "poll_interval_ms": 500}
+    assert _migrate_config(data) is data
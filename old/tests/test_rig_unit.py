@@ -2,7 +2,7 @@ import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from multirig.rig import RigClient, RigctldBackend, RigctlProcessBackend, RigConfig
 from multirig.rig.common import RigStatus
-from multirig.config import BandPreset
+from multirig.config import BandPreset, BandRanges
 
 @pytest.fixture
 def mock_rig_config():
@@ -12,6 +12,7 @@ def mock_rig_config():
     cfg.port = 4532
     cfg.allow_out_of_band = False
     cfg.band_presets = []
+    cfg.band_ranges.side_effect = lambda: BandRanges(cfg.band_presets)
     cfg.enabled = True
     cfg.name = "TestRig"
     cfg.follow_main = True
@@ -67,6 +68,27 @@ async def test_rig_client_set_frequency_block_oob(rig_client, mock_rig_config):
     assert rig_client._last_error == "Frequency out of configured band ranges"
     rig_client._backend.set_frequency.assert_not_called()
 
+def test_band_ranges_merge_and_cache():
+    cfg = RigConfig(band_presets=[
+        BandPreset(label="a", frequency_hz=14_100_000, lower_hz=14_000_000, upper_hz=14_200_000),
+        BandPreset(label="b", frequency_hz=7_100_000, lower_hz=7_000_000, upper_hz=7_300_000),
+        BandPreset(label="c", frequency_hz=14_300_000, lower_hz=14_150_000, upper_hz=14_350_000),
+        BandPreset(label="d", frequency_hz=3_600_000, lower_hz=3_500_000, upper_hz=4_000_000, enabled=False),
+    ])
+    ranges = cfg.band_ranges()
+    assert ranges.lowers == (7_000_000, 14_000_000)
+    assert ranges.uppers == (7_300_000, 14_350_000)
+    assert ranges.has_open is False
+    assert ranges.contains(7_000_000) and ranges.contains(14_350_000)
+    assert not ranges.contains(3_600_000)
+    assert not ranges.contains(10_000_000)
+    assert not ranges.contains(14_350_001)
+    assert cfg.band_ranges() is ranges
+
+    cfg.band_presets = [BandPreset(label="x", frequency_hz=1)]
+    assert cfg.band_ranges() is not ranges
+    assert cfg.band_ranges().has_open is True
+
 @pytest.mark.asyncio
 async def test_rig_client_set_frequency_no_presets(rig_client, mock_rig_config):
     mock_rig_config.allow_out_of_band = False
@@ -275,6 +297,18 @@ async def test_rig_client_status(rig_client):
     st = await rig_client.status()
     assert st.connected is True
     
+@pytest.mark.asyncio
+async def test_rig_client_safe_status_reuses_band_presets(rig_client, mock_rig_config):
+    rig_client._backend.status = AsyncMock(return_value=RigStatus(connected=True))
+    mock_rig_config.band_presets = [BandPreset(label="40m", frequency_hz=7074000)]
+    first = (await rig_client.safe_status())["band_presets"]
+    assert first[0]["label"] == "40m"
+    assert (await rig_client.safe_status())["band_presets"] is first
+
+    # Applying a config replaces the list, which rebuilds the payload
+    mock_rig_config.band_presets = [BandPreset(label="20m", frequency_hz=14074000)]
+    assert (await rig_client.safe_status())["band_presets"][0]["label"] == "20m"
+
 import multirig.rig.common as rig_common
 
 def test_parse_helpers():
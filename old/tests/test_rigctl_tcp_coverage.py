@@ -178,3 +178,27 @@ async def test_handle_client_loop():
     writer.wait_closed = AsyncMock(side_effect=Exception("ignore"))
     reader.readline.side_effect = [b"quit\n"]
     await server._handle_client(reader, writer) # Should not raise
+
+@pytest.mark.asyncio
+async def test_server_reconfigure_rebinds_listener():
+    server = ConcreteRigctlServer()
+    await server.start()
+    try:
+        listener = server._server
+        command_map = server._command_map
+
+        # Same address: listener untouched
+        await server.reconfigure("127.0.0.1", 0)
+        assert server._server is listener
+
+        await server.reconfigure("127.0.0.2", 0)
+        assert server.running
+        assert server._server is not listener
+        assert server._command_map is command_map
+        assert server._server.sockets[0].getsockname()[0] == "127.0.0.2"
+        assert (server._cfg.host, server._cfg.port) == ("127.0.0.2", 0)
+
+        await server.reconfigure("127.0.0.2", 0, start=False)
+        assert not server.running
+    finally:
+        await server.stop()
@@ -0,0 +1,194 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from multirig.router import MessageRouter, collect_rig_statuses
+
+
+class DummyRig:
+    def __init__(self, name="r", *, fail=False, delay=0.0):
+        self.cfg = SimpleNamespace(name=name, enabled=True, follow_main=True)
+        self.fail = fail
+        self.delay = delay
+        self.safe_status_calls = 0
+
+    async def safe_status(self):
+        self.safe_status_calls += 1
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("port busy")
+        return {"name": self.cfg.name, "enabled": True}
+
+
+@pytest.mark.asyncio
+async def test_collect_rig_statuses_runs_concurrently_and_folds_errors():
+    started = []
+
+    class SlowRig(DummyRig):
+        async def safe_status(self):
+            started.append(self.cfg.name)
+            await asyncio.sleep(0.01)
+            # Every rig must have started before any of them finishes
+            assert len(started) == 3
+            return await super().safe_status()
+
+    result = await collect_rig_statuses([SlowRig("a"), SlowRig("b", fail=True), SlowRig("c")])
+    assert result == [
+        {"name": "a", "enabled": True, "index": 0},
+        {"error": "port busy", "index": 1},
+        {"name": "c", "enabled": True, "index": 2},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_get_cached_status_shares_one_refresh_per_interval():
+    rig = DummyRig("a", delay=0.01)
+    router = MessageRouter(poll_interval_ms=60000)
+    router.set_rigs([rig])
+
+    first, second = await asyncio.gather(router.get_cached_status(), router.get_cached_status())
+    third = await router.get_cached_status()
+
+    assert first is second is third
+    assert rig.safe_status_calls == 1
+
+    # Replacing the rigs drops the snapshot
+    router.set_rigs([rig])
+    await router.get_cached_status()
+    assert rig.safe_status_calls == 2
+
+
+@pytest.mark.asyncio
+async def test_keepalive_loop_feeds_all_subscribers_from_one_snapshot():
+    rig = DummyRig("a")
+    router = MessageRouter(poll_interval_ms=60000)
+    router.set_rigs([rig])
+    router.keepalive_s = 0.02
+    queues = [router.subscribe_ws() for _ in range(3)]
+
+    router._running = True
+    task = asyncio.create_task(router._keepalive_loop())
+    try:
+        statuses = [await asyncio.wait_for(q.get(), timeout=1.0) for q in queues]
+    finally:
+        router._running = False
+        task.cancel()
+
+    assert statuses[0] is statuses[1] is statuses[2]
+    assert statuses[0]["rigs"][0]["name"] == "a"
+    assert rig.safe_status_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_broadcast_if_changed_skips_identical_status():
+    rig = DummyRig("a")
+    router = MessageRouter(poll_interval_ms=60000)
+    router.set_rigs([rig])
+    q = router.subscribe_ws()
+
+    assert await router._broadcast_if_changed() is True
+    assert await router._broadcast_if_changed() is False
+    assert q.qsize() == 1
+
+    rig.cfg.name = "b"
+    assert await router._broadcast_if_changed() is True
+    assert q.qsize() == 2
+    q.get_nowait()
+    assert q.get_nowait()["rigs"][0]["name"] == "b"
+
+
+@pytest.mark.asyncio
+async def test_update_all_status_queries_rigs_concurrently():
+    started = []
+
+    class StatusRig(DummyRig):
+        async def status(self):
+            started.append(self.cfg.name)
+            await asyncio.sleep(0.01)
+            assert len(started) == 2
+            if self.fail:
+                raise RuntimeError("port busy")
+            return SimpleNamespace(
+                connected=True, frequency_hz=7074000, mode="USB", passband=2400, error=None
+            )
+
+    router = MessageRouter()
+    router.set_rigs([StatusRig("a", fail=True), StatusRig("b")])
+    await router._update_all_status()
+
+    assert router._status_cache[0].frequency_hz is None
+    assert router._status_cache[1].frequency_hz == 7074000
+
+
+@pytest.mark.asyncio
+async def test_sync_from_command_updates_followers_concurrently():
+    started = []
+
+    class FollowerRig(DummyRig):
+        async def execute(self, cmd):
+            started.append(self.cfg.name)
+            await asyncio.sleep(0.01)
+            assert len(started) == 2
+            if self.fail:
+                raise RuntimeError("port busy")
+
+    rigs = [FollowerRig("src"), FollowerRig("a", fail=True), FollowerRig("b")]
+    rigs[2].cfg.follow_main = True
+    router = MessageRouter(source_index=0)
+    router.set_rigs(rigs)
+
+    await router._sync_from_command(object())
+    assert sorted(started) == ["a", "b"]
+
+
+def test_rig_masks_are_cached_until_invalidated():
+    a, b, c = DummyRig("a"), DummyRig("b"), DummyRig("c")
+    b.cfg.follow_main = False
+    c.cfg.enabled = False
+    router = MessageRouter()
+    router.set_rigs([a, b, c])
+
+    assert router.enabled_indices() == [0, 1]
+    assert router.follower_indices() == [0]
+
+    # In-place config edits are picked up only after invalidation
+    b.cfg.follow_main = True
+    assert router.follower_indices() == [0]
+    router.invalidate_status()
+    assert router.follower_indices() == [0, 1]
+
+
+@pytest.mark.asyncio
+async def test_poll_source_for_sync_updates_followers_concurrently():
+    from multirig.rig.common import RigStatus
+
+    events = []
+
+    class SyncRig(DummyRig):
+        _last_error = None
+
+        async def status(self):
+            return RigStatus(connected=True, frequency_hz=14074000, mode="USB", passband=2400)
+
+        async def set_frequency(self, hz):
+            events.append((self.cfg.name, "freq"))
+            await asyncio.sleep(0.01)
+            return not self.fail
+
+        async def set_mode(self, mode, pb):
+            events.append((self.cfg.name, "mode"))
+            return True
+
+    rigs = [SyncRig("src"), SyncRig("a", fail=True), SyncRig("b")]
+    router = MessageRouter(source_index=0)
+    router.set_rigs(rigs)
+
+    await router._poll_source_for_sync()
+    # Both followers started tuning before either set its mode
+    assert events[:2] == [("a", "freq"), ("b", "freq")]
+    assert sorted(events[2:]) == [("a", "mode"), ("b", "mode")]
+    assert rigs[1]._last_error == "Frequency out of configured band ranges"
+    assert rigs[2]._last_error is None
+    assert router._last_sync_state == (14074000, "USB", 2400)
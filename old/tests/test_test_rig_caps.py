@@ -108,7 +108,9 @@ def client(monkeypatch, tmp_path):
     monkeypatch.setattr(appmod, "load_config", lambda path: cfg)
     monkeypatch.setattr(appmod, "save_config", lambda cfg, path: None)
     import multirig.rig as rigmod
+    import multirig.routes as routesmod
     monkeypatch.setattr(rigmod, "RigClient", DummyRigClient)
+    monkeypatch.setattr(routesmod, "RigClient", DummyRigClient)
     monkeypatch.setattr(appmod, "RigClient", DummyRigClient)
     monkeypatch.setattr(appmod, "SyncService", DummySyncService)
     monkeypatch.setattr(appmod, "AppRigctlServer", DummyRigctlServer)
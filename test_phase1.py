@@ -28,6 +28,21 @@ async def test_serialization():
     print("✓ Serialization works")
 
 
+async def test_serialization_without_orjson():
+    """Test the stdlib json fallback round-trips a dataclass."""
+    from multirig.zenoh import serialization
+
+    saved = serialization.orjson
+    serialization.orjson = None
+    try:
+        state = RigState(rig_id="rig2", timestamp=time.time(), connected=True, frequency=7074000)
+        restored = deserialize(serialize(state), RigState)
+    finally:
+        serialization.orjson = saved
+    assert restored == state
+    print("✓ Serialization works without orjson")
+
+
 async def test_pubsub():
     """Test pub/sub with message types."""
     await init_session()
@@ -64,6 +79,7 @@ async def test_pubsub():
 
 async def main():
     await test_serialization()
+    await test_serialization_without_orjson()
     await test_pubsub()
     print("\n✓ All Phase 1 tests passed!")
 
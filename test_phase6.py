@@ -161,6 +161,33 @@ async def test_config_store():
     await close_session()
 
 
+async def test_config_store_saves_changes_made_during_write():
+    """Test an edit made while a debounced save is writing gets saved too."""
+    print("\n=== Test 4b: Config Store Save During Write ===")
+    import multirig.engines.config_store as config_store_mod
+
+    store = ConfigStore(profile_name="test")
+    store.config = AppConfig(rigs=[RigConfig(rig_id="rig1", name="Rig 1")])
+    saved = []
+
+    def slow_write(config):
+        time.sleep(0.1)
+        saved.append(config.rigs[0].name)
+    store._write_config = slow_write
+
+    saved_delay = config_store_mod.SAVE_DELAY_S
+    config_store_mod.SAVE_DELAY_S = 0.01
+    try:
+        store.save_config()
+        await asyncio.sleep(0.05)  # the first save is now writing
+        store.update_rig("rig1", {"name": "Renamed"})
+        await store.flush()
+    finally:
+        config_store_mod.SAVE_DELAY_S = saved_delay
+    assert saved == ["Rig 1", "Renamed"]
+    print("✓ Change made during a save was persisted")
+
+
 async def test_config_queryable():
     """Test Zenoh queryable for config."""
     print("\n=== Test 5: Config Queryable ===")
@@ -322,6 +349,7 @@ async def main():
     await test_config_persistence()
     await test_band_detection()
     await test_config_store()
+    await test_config_store_saves_changes_made_during_write()
     await test_config_queryable()
     await test_rig_discovery()
     await test_config_change_notifications()